@@ -7,7 +7,9 @@ Repository: https://github.com/dekouninter/EasyCut
 Version: 1.4.0
 """
 
-from typing import Dict
+from __future__ import annotations
+
+import types
 
 try:
     from font_loader import LOADED_FONT_FAMILY
@@ -153,6 +155,12 @@ class ColorPalette:
     }
 
 
+# Palettes are shared by every DesignTokens instance (and cached by widgets),
+# so freeze them — keys are source literals and therefore already interned
+ColorPalette.DARK = types.MappingProxyType(ColorPalette.DARK)
+ColorPalette.LIGHT = types.MappingProxyType(ColorPalette.LIGHT)
+
+
 class Typography:
     """Typography system — Modern hierarchy with comfortable sizes"""
     
@@ -264,17 +272,33 @@ class DesignTokens:
 class ModernTheme:
     """Theme implementation for ttk widgets — v2.0"""
     
+    # Built style configs per (dark_mode, font_family) — treated as read-only
+    _STYLE_CACHE: dict[tuple, dict] = {}
+    
     def __init__(self, dark_mode: bool = True, font_family: str = None):
         self.tokens = DesignTokens(dark_mode)
         self.dark_mode = dark_mode
         self.font_family = font_family or Typography.FONT_FAMILY
+        self._fonts: dict[tuple, tuple] = {}
     
     def _font(self, size, weight="normal"):
-        """Helper to create font tuple"""
-        return (self.font_family, size, weight)
+        """Helper to create font tuple (one shared tuple per size/weight)"""
+        key = (size, weight)
+        font = self._fonts.get(key)
+        if font is None:
+            font = self._fonts[key] = (self.font_family, size, weight)
+        return font
+    
+    def get_ttk_style_config(self) -> dict:
+        """Get complete ttk style configuration (cached per mode and font)"""
+        key = (bool(self.dark_mode), self.font_family)
+        config = self._STYLE_CACHE.get(key)
+        if config is None:
+            config = self._STYLE_CACHE[key] = self._build_ttk_style_config()
+        return config
     
-    def get_ttk_style_config(self) -> Dict:
-        """Get complete ttk style configuration"""
+    def _build_ttk_style_config(self) -> dict:
+        """Build the ttk style configuration for the current mode"""
         c = self.tokens.colors
         sp = Spacing
         ty = Typography
@@ -800,14 +824,13 @@ class ModernTheme:
         }
     
     def apply_to_style(self, style_obj):
-        """Apply theme to ttk.Style object"""
-        config = self.get_ttk_style_config()
+        """Apply theme to ttk.Style object
         
-        for widget_class, settings in config.items():
-            if "configure" in settings:
-                style_obj.configure(widget_class, **settings["configure"])
-            if "map" in settings:
-                style_obj.map(widget_class, **settings["map"])
+        The config already uses ttk's theme_settings() format, so the whole
+        table goes to Tcl as one script instead of a configure()/map() call
+        per style.
+        """
+        style_obj.theme_settings(style_obj.theme_use(), self.get_ttk_style_config())
     
     def toggle(self):
         """Toggle theme mode"""
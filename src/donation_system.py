@@ -29,6 +29,26 @@ try:
 except ImportError:
     DesignTokens = None
 
+_accent_colors = None
+
+
+def _get_accent_colors():
+    """Accent/hover colors from the theme, resolved once for every button
+    
+    Returns:
+        tuple: (accent, accent_hover) hex colors
+    """
+    global _accent_colors
+    if _accent_colors is None:
+        colors = ("#4A90D9", "#3A7BC8")  # Defaults if design_system is missing
+        try:
+            tokens = DesignTokens()
+            colors = (tokens.get_color("accent_primary"), tokens.get_color("accent_hover"))
+        except Exception:
+            pass  # Use defaults
+        _accent_colors = colors
+    return _accent_colors
+
 
 class DonationWindow:
     """Professional Donation Support Window
@@ -37,6 +57,9 @@ class DonationWindow:
     and links to support the EasyCut project development.
     """
     
+    WIDTH = 400
+    HEIGHT = 300
+    
     def __init__(self, parent, translator=None):
         """Initialize donation window
         
@@ -47,6 +70,8 @@ class DonationWindow:
         self.parent = parent
         self.t = translator or _default_translator
         self.window = None
+        self._map_binding = None
+        self._centered = False
         self.donation_links = {
             "coffee": {
                 "name": "Buy Me a Coffee",
@@ -68,13 +93,46 @@ class DonationWindow:
         
         self.window = tk.Toplevel(self.parent)
         self.window.title(self.t("donation_title"))
-        self.window.geometry("400x300")
+        self.window.geometry(f"{self.WIDTH}x{self.HEIGHT}")
         self.window.resizable(False, False)
         
-        # Center window on parent
+        # Center window on parent (retried on <Map> if the parent isn't shown yet)
         self.window.transient(self.parent)
         self.window.grab_set()
+        self._centered = self._center_on_parent()
         
+        # Build the body once the window is mapped so it appears immediately;
+        # the cost is a single frame of empty dialog before content shows
+        self._map_binding = self.window.bind("<Map>", self._on_first_map, add="+")
+    
+    def _on_first_map(self, event):
+        """Build dialog content on first <Map> of the window itself"""
+        if event.widget is not self.window:
+            return
+        self.window.unbind("<Map>", self._map_binding)
+        if not self._centered:
+            self._centered = self._center_on_parent()
+        self._build_body()
+    
+    def _center_on_parent(self):
+        """Center the dialog over the parent window
+        
+        The dialog size is fixed, so no update_idletasks() is needed. Skipped
+        while the parent is unmapped, since its geometry is still 1x1.
+        
+        Returns:
+            bool: True if the window was positioned
+        """
+        parent = self.parent
+        if not parent.winfo_viewable() or parent.winfo_width() <= 1:
+            return False
+        x = parent.winfo_rootx() + (parent.winfo_width() - self.WIDTH) // 2
+        y = parent.winfo_rooty() + (parent.winfo_height() - self.HEIGHT) // 2
+        self.window.geometry(f"{self.WIDTH}x{self.HEIGHT}+{max(x, 0)}+{max(y, 0)}")
+        return True
+    
+    def _build_body(self):
+        """Create title, description and platform buttons"""
         # Main frame
         main_frame = ttk.Frame(self.window, padding=20)
         main_frame.pack(fill=tk.BOTH, expand=True)
@@ -101,14 +159,7 @@ class DonationWindow:
         buttons_frame.pack(pady=10)
         
         # Get accent color from theme
-        accent = "#4A90D9"
-        accent_hover = "#3A7BC8"
-        try:
-            tokens = DesignTokens()
-            accent = tokens.get_color("accent_primary")
-            accent_hover = tokens.get_color("accent_hover")
-        except Exception:
-            pass  # Use defaults
+        accent, accent_hover = _get_accent_colors()
         
         # Donation platform buttons
         for key, donation in self.donation_links.items():
@@ -178,14 +229,7 @@ class DonationButton:
             root_window: Root window for button placement
         """
         # Get accent color from theme
-        accent = "#4A90D9"
-        accent_hover = "#3A7BC8"
-        try:
-            tokens = DesignTokens()
-            accent = tokens.get_color("accent_primary")
-            accent_hover = tokens.get_color("accent_hover")
-        except Exception:
-            pass  # Use defaults
+        accent, accent_hover = _get_accent_colors()
         
         # Floating button frame
         floating_frame = ttk.Frame(root_window)
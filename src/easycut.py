@@ -23,11 +23,14 @@ Features:
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import threading
+import functools
+import importlib.util
 import logging
 import re
 import sys
 import os
 import shutil
+import webbrowser
 from pathlib import Path
 from datetime import datetime
 
@@ -41,16 +44,85 @@ from icon_manager import icon_manager, get_ui_icon, set_icon_theme
 from design_system import ModernTheme, DesignTokens, Typography, Spacing, Icons
 from modern_components import (
     ModernButton, ModernCard, SectionHeader, StatusDot, Tooltip, Badge, Divider,
-    EMOJI_ICONS
+    EMOJI_ICONS, reset_icon_cache
 )
 from font_loader import setup_fonts, LOADED_FONT_FAMILY
 
 # Import external libraries
-try:
+# yt_dlp is only probed here; the package itself is imported on first use,
+# since loading its extractor modules is a large share of startup time
+YT_DLP_AVAILABLE = importlib.util.find_spec("yt_dlp") is not None
+
+
+def _yt_dlp():
+    """Import yt_dlp on first use (cached in sys.modules afterwards)"""
     import yt_dlp
-    YT_DLP_AVAILABLE = True
-except ImportError:
-    YT_DLP_AVAILABLE = False
+    return yt_dlp
+
+
+def _fit_scrollregion(event):
+    """<Configure> handler for a canvas' inner frame: fit scrollregion to its content"""
+    canvas = event.widget.master
+    canvas.configure(scrollregion=canvas.bbox("all"))
+
+
+def _fit_content_width(event):
+    """<Configure> handler for a scroll canvas: stretch its "content" window to the canvas width"""
+    event.widget.itemconfig("content", width=event.width)
+
+
+# Static (label, value) rows for the About section, shared by every rebuild of the UI
+_ABOUT_INFO = (
+    ("Version:", "1.4.0"),
+    ("Author:", "Deko Costa"),
+    ("License:", "GPL-3.0"),
+    ("Release:", "2026"),
+)
+
+_ABOUT_TECH = (
+    ("Core:", "Python 3.13 + Tkinter"),
+    ("Downloader:", "yt-dlp (Unlicense)"),
+    ("Converter:", "FFmpeg (GPL-2.0+)"),
+    ("Security:", "OAuth 2.0"),
+    ("Icons:", "Feather Icons (MIT)"),
+    ("Font:", "Inter (OFL 1.1)"),
+    ("Image:", "Pillow (HPND)"),
+)
+
+# (translation key, default label, url)
+_ABOUT_LINKS = (
+    ("about_link_github", "GitHub Repository", "https://github.com/dekouninter/EasyCut"),
+    ("about_link_coffee", "Buy Me a Coffee", "https://buymeacoffee.com/dekocosta"),
+    ("about_link_kofi", "Support on Ko-fi", "https://ko-fi.com/dekocosta"),
+    ("about_link_livepix", "Livepix (Brazil)", "https://livepix.gg/dekocosta"),
+)
+
+# Download option tables: (value, translation key, default label);
+# a None key means the label is not translated
+_DOWNLOAD_MODES = (
+    ("full", "download_mode_full", "Complete Video"),
+    ("range", "download_mode_range", "Time Range"),
+    ("until", "download_mode_until", "Until Time"),
+    ("audio", "download_mode_audio", "Audio Only"),
+    ("playlist", "download_mode_playlist", "Full Playlist"),
+    ("channel", "download_mode_channel", "Channel Videos"),
+)
+
+_DOWNLOAD_QUALITIES = (
+    ("best", "download_quality_best", "Best Quality"),
+    ("mp4", "download_quality_mp4", "MP4 (Best)"),
+    ("1080", None, "1080p Full HD"),
+    ("720", None, "720p HD"),
+)
+
+_AUDIO_FORMATS = ("mp3", "wav", "m4a", "opus")
+_AUDIO_BITRATES = ("128", "192", "256", "320")
+
+_TRANSLATE_LANGS = (
+    "pt", "es", "fr", "de", "it", "ja", "ko", "zh-Hans",
+    "zh-Hant", "ru", "ar", "hi", "tr", "pl", "nl", "sv",
+    "id", "vi", "th", "uk", "cs", "el", "ro", "hu",
+)
 
 class EasyCutApp:
     """Professional YouTube Downloader Application"""
@@ -80,10 +152,13 @@ class EasyCutApp:
         # State
         self.is_downloading = False
         self.active_scroll_canvas = None  # Track active canvas for mouse wheel scroll
+        self._mousewheel_bound = False  # Global wheel handler registered
         self.browser_var = None  # Browser selection variable
         self.download_semaphore = threading.BoundedSemaphore(value=3)
         self._video_formats = []  # Fetched format list from yt-dlp
         self._video_info_cache = {}  # Cached metadata from last verify
+        self._verifying_url = None  # URL whose metadata fetch is in flight
+        self._auth_generation = 0  # Bumped by manual login/logout; stale refresh results are dropped
         self._format_id_map = {}  # Maps combo index to format_id
         self._channel_limit_var = None  # Channel video limit spinbox variable
         self._thumbnail_cache = {}  # video_id -> PhotoImage for history
@@ -146,7 +221,7 @@ class EasyCutApp:
         self.logger = logging.getLogger(__name__)
         self.logger.info("="*60)
         self.logger.info("EasyCut Application Started")
-        self.logger.info(f"Version: 1.4.0")
+        self.logger.info("Version: 1.4.0")
     
     def setup_window(self):
         """Setup main window"""
@@ -199,13 +274,16 @@ class EasyCutApp:
         self.section_container.grid_rowconfigure(0, weight=1)
         self.section_container.grid_columnconfigure(0, weight=1)
 
-        # Create sections as stacked frames
+        # Create sections as stacked frames. Sections listed in
+        # _section_builders are only built the first time they are shown.
+        self._section_builders = {
+            "batch": self.create_batch_tab,
+            "history": self.create_history_tab,
+            "about": self.create_about_tab,
+        }
         self.section_frames["download"] = self.create_download_tab()
-        self.section_frames["batch"] = self.create_batch_tab()
         self.section_frames["live"] = self.create_live_tab()
-        self.section_frames["history"] = self.create_history_tab()
         self.section_frames["settings"] = self.create_settings_tab()
-        self.section_frames["about"] = self.create_about_tab()
         
         # Select initial section
         self._switch_section("download")
@@ -247,9 +325,6 @@ class EasyCutApp:
         hover_bg = self.design.get_color("sidebar_hover")
         active_bg = self.design.get_color("sidebar_active")
         
-        # Set sidebar bg
-        self.sidebar_frame.config(bg=bg)
-        
         # Toggle button with hover effect
         toggle_frame = tk.Frame(self.sidebar_frame, bg=bg)
         toggle_frame.pack(fill=tk.X, padx=Spacing.SM, pady=(Spacing.MD, Spacing.LG))
@@ -281,10 +356,9 @@ class EasyCutApp:
             outer = tk.Frame(nav_container, bg=bg)
             outer.pack(fill=tk.X, pady=2)
             
-            btn_frame = tk.Frame(outer, bg=bg, cursor="hand2")
+            btn_frame = tk.Frame(outer, bg=bg, cursor="hand2", height=Spacing.SIDEBAR_ITEM_H)
             btn_frame.pack(fill=tk.X, padx=Spacing.XS)
             btn_frame.pack_propagate(False)
-            btn_frame.config(height=Spacing.SIDEBAR_ITEM_H)
             btn_frame.grid_columnconfigure(2, weight=1)
             
             # Active indicator (left rounded accent bar)
@@ -428,8 +502,10 @@ class EasyCutApp:
                 refs["text"].config(bg=bg, fg=fg_sec,
                                     font=(Typography.FONT_FAMILY, Typography.SIZE_BODY))
         
-        # Switch visible section frame
+        # Switch visible section frame (building it on first visit if deferred)
         frame = self.section_frames.get(key)
+        if frame is None and key in self._section_builders:
+            frame = self.section_frames[key] = self._section_builders.pop(key)()
         if frame:
             frame.tkraise()
     
@@ -769,7 +845,6 @@ class EasyCutApp:
         cookies_file_label.pack(side=tk.LEFT, padx=(0, Spacing.SM))
         
         def select_cookies_file():
-            from tkinter import filedialog
             filepath = filedialog.askopenfilename(
                 title=tr("browser_cookies_file_button", "Select Cookies File"),
                 filetypes=[("Text files", "*.txt"), ("All files", "*.*")]
@@ -949,8 +1024,8 @@ class EasyCutApp:
         # Sync button
         def handle_sync():
             """Handle clicking the sync button"""
-            if self.oauth_manager.is_authenticated():
-                # Already authenticated
+            if self.oauth_manager.has_credentials():
+                # Already authenticated (or refreshable without the browser)
                 result = messagebox.askyesno(
                     "Info",
                     "Already authenticated! Re-authenticate?"
@@ -958,6 +1033,9 @@ class EasyCutApp:
                 if not result:
                     return
             
+            # Results of refreshes started before this login are now stale
+            self._auth_generation += 1
+            
             # Show loading state
             sync_btn.config(state="disabled")
             self.account_status_label.config(
@@ -1030,6 +1108,7 @@ class EasyCutApp:
                 "Remove YouTube authentication?"
             )
             if result:
+                self._auth_generation += 1
                 self.oauth_manager.logout()
                 self.account_status_label.config(
                     text="Not authenticated",
@@ -1052,11 +1131,21 @@ class EasyCutApp:
         status_frame = tk.Frame(inner, bg=bg)
         status_frame.pack(fill=tk.X, pady=(Spacing.XS, 0))
         
-        # Status dot indicator
-        if self.oauth_manager.is_authenticated():
+        # Status dot indicator. A saved token that only needs a refresh
+        # counts as signed in; the label is corrected once the refresh ends.
+        oauth = self.oauth_manager
+        if oauth.has_valid_token():
             status_text = "Authenticated and ready"
             status_color = self.design.get_color("success")
             dot_status = "online"
+        elif oauth.has_credentials():
+            status_text = "Refreshing session..."
+            status_color = self.design.get_color("warning")
+            dot_status = "warning"
+            generation = self._auth_generation
+            oauth.refresh_in_background(
+                on_done=lambda ok: self.root.after(0, self._on_token_refreshed, ok, generation)
+            )
         else:
             status_text = "Not authenticated yet"
             status_color = self.design.get_color("fg_secondary")
@@ -1074,8 +1163,26 @@ class EasyCutApp:
         self.account_status_label.pack(side=tk.LEFT)
         
         # Subtle bottom separator
-        Divider(parent, dark_mode=self.dark_mode).pack(fill=tk.X, padx=Spacing.LG)
+        Divider(parent, dark_mode=self.dark_mode).pack(fill=tk.X, padx=Spacing.LG, pady=Spacing.SM)
     
+    def _on_token_refreshed(self, ok, generation):
+        """Update the auth banner after a background token refresh (Tk thread)
+        
+        Dropped if a manual login or logout happened since the refresh was
+        requested, so it can't overwrite that flow's status.
+        """
+        if generation != self._auth_generation:
+            return
+        label = getattr(self, "account_status_label", None)
+        dot = getattr(self, "auth_status_dot", None)
+        if label is None or not label.winfo_exists():
+            return
+        if ok:
+            label.config(text="Authenticated and ready", fg=self.design.get_color("success"))
+        else:
+            label.config(text="Not authenticated yet", fg=self.design.get_color("fg_secondary"))
+        if dot is not None and dot.winfo_exists():
+            dot.set_status("online" if ok else "offline")
     
     def create_download_tab(self):
         """Create download section"""
@@ -1090,12 +1197,12 @@ class EasyCutApp:
         scrollbar = ttk.Scrollbar(frame, orient=tk.VERTICAL, command=main_canvas.yview)
         main = ttk.Frame(main_canvas, padding=Spacing.LG)
         
-        main.bind("<Configure>", lambda e: main_canvas.configure(scrollregion=main_canvas.bbox("all")))
+        main.bind("<Configure>", _fit_scrollregion)
         main_canvas.create_window((0, 0), window=main, anchor="nw", tags="content")
         main_canvas.configure(yscrollcommand=scrollbar.set)
         
         # Update inner frame width on canvas resize
-        main_canvas.bind("<Configure>", lambda e: main_canvas.itemconfig("content", width=e.width))
+        main_canvas.bind("<Configure>", _fit_content_width)
         
         main_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
@@ -1230,22 +1337,13 @@ class EasyCutApp:
         
         self.download_mode_var = tk.StringVar(value="full")
         
-        modes = [
-            ("full", tr("download_mode_full", "Complete Video")),
-            ("range", tr("download_mode_range", "Time Range")),
-            ("until", tr("download_mode_until", "Until Time")),
-            ("audio", tr("download_mode_audio", "Audio Only")),
-            ("playlist", tr("download_mode_playlist", "Full Playlist")),
-            ("channel", tr("download_mode_channel", "Channel Videos"))
-        ]
-        
         mode_grid = ttk.Frame(mode_card.body)
         mode_grid.pack(fill=tk.X)
         
-        for i, (value, text) in enumerate(modes):
+        for i, (value, key, default) in enumerate(_DOWNLOAD_MODES):
             ttk.Radiobutton(
                 mode_grid,
-                text=text,
+                text=tr(key, default),
                 variable=self.download_mode_var,
                 value=value
             ).grid(row=i // 2, column=i % 2, sticky=tk.W, padx=Spacing.SM, pady=Spacing.XS)
@@ -1311,20 +1409,13 @@ class EasyCutApp:
         
         self.download_quality_var = tk.StringVar(value="best")
         
-        qualities = [
-            ("best", tr("download_quality_best", "Best Quality")),
-            ("mp4", tr("download_quality_mp4", "MP4 (Best)")),
-            ("1080", "1080p Full HD"),
-            ("720", "720p HD")
-        ]
-        
         quality_grid = ttk.Frame(quality_card.body)
         quality_grid.pack(fill=tk.X)
         
-        for i, (value, text) in enumerate(qualities):
+        for i, (value, key, default) in enumerate(_DOWNLOAD_QUALITIES):
             ttk.Radiobutton(
                 quality_grid,
-                text=text,
+                text=tr(key, default) if key else default,
                 variable=self.download_quality_var,
                 value=value
             ).grid(row=i // 2, column=i % 2, sticky=tk.W, padx=Spacing.SM, pady=Spacing.XS)
@@ -1333,38 +1424,24 @@ class EasyCutApp:
         audio_card = ModernCard(main, title=tr("audio_format", "Audio Format"), dark_mode=self.dark_mode)
         audio_card.pack(fill=tk.X, pady=(0, Spacing.MD))
         
-        # Format selection
-        self.audio_format_var = tk.StringVar(value="mp3")
-        
-        fmt_frame = ttk.Frame(audio_card.body)
-        fmt_frame.pack(fill=tk.X, pady=(0, Spacing.MD))
-        
-        formats = [("mp3", "MP3"), ("wav", "WAV"), ("m4a", "M4A"), ("opus", "OPUS")]
-        for value, text in formats:
-            ttk.Radiobutton(
-                fmt_frame,
-                text=text,
-                variable=self.audio_format_var,
-                value=value
-            ).pack(side=tk.LEFT, padx=(0, Spacing.LG))
+        # Format and bitrate selection (one readonly combobox each)
+        audio_row = ttk.Frame(audio_card.body)
+        audio_row.pack(fill=tk.X)
         
-        # Bitrate selection
-        ttk.Label(audio_card.body, text=f"{tr('audio_bitrate', 'Bitrate')}:", style="Subtitle.TLabel").pack(
-            anchor=tk.W, pady=(Spacing.SM, Spacing.XS)
-        )
+        ttk.Label(audio_row, text=f"{tr('audio_format_label', 'Format')}:", style="Subtitle.TLabel").pack(side=tk.LEFT, padx=(0, Spacing.SM))
+        self.audio_format_var = tk.StringVar(value="mp3")
+        ttk.Combobox(
+            audio_row, textvariable=self.audio_format_var,
+            values=_AUDIO_FORMATS, width=8, state="readonly"
+        ).pack(side=tk.LEFT, padx=(0, Spacing.LG))
         
+        ttk.Label(audio_row, text=f"{tr('audio_bitrate', 'Bitrate')}:", style="Subtitle.TLabel").pack(side=tk.LEFT, padx=(0, Spacing.SM))
         self.audio_bitrate_var = tk.StringVar(value="320")
-        
-        bitrate_frame = ttk.Frame(audio_card.body)
-        bitrate_frame.pack(fill=tk.X)
-        
-        for br in ["128", "192", "256", "320"]:
-            ttk.Radiobutton(
-                bitrate_frame,
-                text=f"{br} kbps",
-                variable=self.audio_bitrate_var,
-                value=br
-            ).pack(side=tk.LEFT, padx=(0, Spacing.LG))
+        ttk.Combobox(
+            audio_row, textvariable=self.audio_bitrate_var,
+            values=_AUDIO_BITRATES, width=6, state="readonly"
+        ).pack(side=tk.LEFT)
+        ttk.Label(audio_row, text="kbps", style="Caption.TLabel").pack(side=tk.LEFT, padx=(Spacing.XS, 0))
         
         # === SUBTITLE CARD ===
         sub_card = ModernCard(main, title=tr("sub_title", "Subtitles"), dark_mode=self.dark_mode)
@@ -1432,15 +1509,10 @@ class EasyCutApp:
         
         # Common language presets + custom entry
         self.sub_translate_lang_var = tk.StringVar(value="pt")
-        translate_langs = [
-            "pt", "es", "fr", "de", "it", "ja", "ko", "zh-Hans",
-            "zh-Hant", "ru", "ar", "hi", "tr", "pl", "nl", "sv",
-            "id", "vi", "th", "uk", "cs", "el", "ro", "hu"
-        ]
         translate_combo = ttk.Combobox(
             translate_lang_frame,
             textvariable=self.sub_translate_lang_var,
-            values=translate_langs,
+            values=_TRANSLATE_LANGS,
             width=10,
         )
         translate_combo.pack(side=tk.LEFT, padx=(0, Spacing.SM))
@@ -1651,13 +1723,10 @@ class EasyCutApp:
         queue_scrollbar = ttk.Scrollbar(queue_card.body, orient=tk.VERTICAL, command=queue_canvas.yview)
         self.queue_list_frame = ttk.Frame(queue_canvas)
         
-        self.queue_list_frame.bind(
-            "<Configure>",
-            lambda e: queue_canvas.configure(scrollregion=queue_canvas.bbox("all"))
-        )
+        self.queue_list_frame.bind("<Configure>", _fit_scrollregion)
         queue_canvas.create_window((0, 0), window=self.queue_list_frame, anchor="nw", tags="content")
         queue_canvas.configure(yscrollcommand=queue_scrollbar.set)
-        queue_canvas.bind("<Configure>", lambda e: queue_canvas.itemconfig("content", width=e.width))
+        queue_canvas.bind("<Configure>", _fit_content_width)
         
         queue_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         queue_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
@@ -1808,13 +1877,13 @@ class EasyCutApp:
         self.live_audio_format_var = tk.StringVar(value="mp3")
         ttk.Combobox(
             audio_row, textvariable=self.live_audio_format_var,
-            values=["mp3", "wav", "m4a", "opus"], width=8, state="readonly"
+            values=_AUDIO_FORMATS, width=8, state="readonly"
         ).pack(side=tk.LEFT, padx=(0, Spacing.MD))
         ttk.Label(audio_row, text=f"{tr('audio_bitrate', 'Bitrate')}:", style="Caption.TLabel").pack(side=tk.LEFT, padx=(0, Spacing.SM))
         self.live_audio_bitrate_var = tk.StringVar(value="192")
         ttk.Combobox(
             audio_row, textvariable=self.live_audio_bitrate_var,
-            values=["128", "192", "256", "320"], width=6, state="readonly"
+            values=_AUDIO_BITRATES, width=6, state="readonly"
         ).pack(side=tk.LEFT)
         
         # Subtitles
@@ -1949,16 +2018,13 @@ class EasyCutApp:
         scrollbar = ttk.Scrollbar(table_card.body, orient=tk.VERTICAL, command=canvas.yview)
         self.history_records_frame = ttk.Frame(canvas)
         
-        self.history_records_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        self.history_records_frame.bind("<Configure>", _fit_scrollregion)
         
         canvas.create_window((0, 0), window=self.history_records_frame, anchor="nw", tags="content")
         canvas.configure(yscrollcommand=scrollbar.set)
         
         # Update inner frame width on canvas resize
-        canvas.bind("<Configure>", lambda e: canvas.itemconfig("content", width=e.width))
+        canvas.bind("<Configure>", _fit_content_width)
         
         canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
@@ -1973,7 +2039,6 @@ class EasyCutApp:
     def create_settings_tab(self):
         """Create settings configuration section"""
         tr = self.translator.get
-        from tkinter import filedialog
         
         frame = ttk.Frame(self.section_container)
         frame.grid(row=0, column=0, sticky="nsew")
@@ -1983,12 +2048,12 @@ class EasyCutApp:
         scrollbar = ttk.Scrollbar(frame, orient="vertical", command=main_canvas.yview)
         main = ttk.Frame(main_canvas, padding=Spacing.LG)
         
-        main.bind("<Configure>", lambda e: main_canvas.configure(scrollregion=main_canvas.bbox("all")))
+        main.bind("<Configure>", _fit_scrollregion)
         main_canvas.create_window((0, 0), window=main, anchor="nw", tags="content")
         main_canvas.configure(yscrollcommand=scrollbar.set)
         
         # Fix: Update inner frame width on canvas resize (was missing before)
-        main_canvas.bind("<Configure>", lambda e: main_canvas.itemconfig("content", width=e.width))
+        main_canvas.bind("<Configure>", _fit_content_width)
         
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         main_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
@@ -2177,8 +2242,10 @@ class EasyCutApp:
         
         self._sched_url_entry = ttk.Entry(sched_row, width=35, font=(LOADED_FONT_FAMILY, Typography.SIZE_MD))
         self._sched_url_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, Spacing.SM))
-        self._sched_url_entry.insert(0, tr("scheduler_url_placeholder", "URL to download..."))
-        self._sched_url_entry.bind("<FocusIn>", lambda e: self._sched_url_entry.delete(0, tk.END) if tr("scheduler_url_placeholder", "URL to download...") in self._sched_url_entry.get() else None)
+        self._sched_showing_placeholder = False
+        self._sched_restore_placeholder()
+        self._sched_url_entry.bind("<FocusIn>", self._sched_clear_placeholder)
+        self._sched_url_entry.bind("<FocusOut>", self._sched_restore_placeholder)
         
         sched_btn_row = ttk.Frame(sched_card.body)
         sched_btn_row.pack(fill=tk.X, pady=(0, Spacing.SM))
@@ -2260,7 +2327,6 @@ class EasyCutApp:
     
     def _browse_cookie_file(self):
         """Browse for cookie file"""
-        from tkinter import filedialog
         path = filedialog.askopenfilename(
             title="Select cookies.txt",
             filetypes=[("Text files", "*.txt"), ("All files", "*.*")]
@@ -2271,7 +2337,6 @@ class EasyCutApp:
     
     def _export_archive(self):
         """Export archive file"""
-        from tkinter import filedialog
         tr = self.translator.get
         archive_path = Path(self.config_manager.config_dir) / "download_archive.txt"
         if not archive_path.exists():
@@ -2283,13 +2348,11 @@ class EasyCutApp:
             initialfile="easycut_archive.txt"
         )
         if dest:
-            import shutil
             shutil.copy2(archive_path, dest)
             messagebox.showinfo(tr("msg_info", "Info"), tr("settings_saved", "Exported!"))
     
     def _import_archive(self):
         """Import archive file"""
-        from tkinter import filedialog
         tr = self.translator.get
         src = filedialog.askopenfilename(filetypes=[("Text files", "*.txt")])
         if src:
@@ -2469,13 +2532,26 @@ class EasyCutApp:
     
     # === DOWNLOAD SCHEDULER ===
     
+    def _sched_clear_placeholder(self, event=None):
+        """Remove the scheduler URL placeholder before the user types"""
+        if self._sched_showing_placeholder:
+            self._sched_url_entry.delete(0, tk.END)
+            self._sched_showing_placeholder = False
+    
+    def _sched_restore_placeholder(self, event=None):
+        """Show the scheduler URL placeholder when the entry is empty"""
+        if not self._sched_url_entry.get():
+            self._sched_url_entry.insert(
+                0, self.translator.get("scheduler_url_placeholder", "URL to download...")
+            )
+            self._sched_showing_placeholder = True
+    
     def _schedule_download(self):
         """Add a URL to the scheduled downloads list"""
         tr = self.translator.get
-        url = self._sched_url_entry.get().strip()
-        placeholder = tr("scheduler_url_placeholder", "URL to download...")
+        url = "" if self._sched_showing_placeholder else self._sched_url_entry.get().strip()
         
-        if not url or url == placeholder:
+        if not url:
             messagebox.showwarning(tr("msg_warning", "Warning"), tr("scheduler_no_url", "Enter a URL to schedule"))
             return
         
@@ -2497,9 +2573,11 @@ class EasyCutApp:
         }
         self._scheduled_downloads.append(sched_item)
         
-        # Clear entry
+        # Clear entry. Clicking the button doesn't move focus, so the entry
+        # usually still has it; <FocusOut> restores the placeholder later.
         self._sched_url_entry.delete(0, tk.END)
-        self._sched_url_entry.insert(0, placeholder)
+        if self.root.focus_get() is not self._sched_url_entry:
+            self._sched_restore_placeholder()
         
         self._refresh_sched_ui()
         
@@ -2733,6 +2811,16 @@ class EasyCutApp:
             self.is_downloading = False
             self.start_download()
     
+    def _build_about_rows(self, parent, rows):
+        """Lay out (label, value) rows on a single grid instead of one frame per row"""
+        grid = ttk.Frame(parent)
+        grid.pack(fill=tk.X)
+        for r, (label, value) in enumerate(rows):
+            ttk.Label(grid, text=label, style="Subtitle.TLabel", width=12).grid(
+                row=r, column=0, sticky="w", pady=(0, Spacing.XS))
+            ttk.Label(grid, text=value, style="Caption.TLabel").grid(
+                row=r, column=1, sticky="w", pady=(0, Spacing.XS))
+    
     def create_about_tab(self):
         """Create about section"""
         tr = self.translator.get
@@ -2744,16 +2832,13 @@ class EasyCutApp:
         scrollbar = ttk.Scrollbar(frame, orient=tk.VERTICAL, command=canvas.yview)
         scrollable_frame = ttk.Frame(canvas)
         
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        scrollable_frame.bind("<Configure>", _fit_scrollregion)
         
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw", tags="content")
         canvas.configure(yscrollcommand=scrollbar.set)
         
         # Update inner frame width on canvas resize
-        canvas.bind("<Configure>", lambda e: canvas.itemconfig("content", width=e.width))
+        canvas.bind("<Configure>", _fit_content_width)
         
         canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
@@ -2810,39 +2895,17 @@ class EasyCutApp:
         info_card = ModernCard(main, title=tr("about_section_info", "Application Info"), dark_mode=self.dark_mode)
         info_card.pack(fill=tk.X, pady=(0, Spacing.MD))
         
-        info_data = [
-            ("Version", "1.4.0"),
-            ("Author", "Deko Costa"),
-            ("License", "GPL-3.0"),
-            ("Release", "2026")
-        ]
-        
-        for label, value in info_data:
-            row = ttk.Frame(info_card.body)
-            row.pack(fill=tk.X, pady=(0, Spacing.XS))
-            ttk.Label(row, text=f"{label}:", style="Subtitle.TLabel", width=12).pack(side=tk.LEFT)
-            ttk.Label(row, text=value, style="Caption.TLabel").pack(side=tk.LEFT)
+        self._build_about_rows(info_card.body, _ABOUT_INFO)
         
         # === SOCIAL LINKS CARD ===
         social_card = ModernCard(main, title=tr("about_section_links", "Connect & Support"), dark_mode=self.dark_mode)
         social_card.pack(fill=tk.X, pady=(0, Spacing.MD))
         
-        def open_link(url):
-            import webbrowser
-            webbrowser.open(url)
-        
-        links = [
-            (tr("about_link_github", "GitHub Repository"), "https://github.com/dekouninter/EasyCut"),
-            (tr("about_link_coffee", "Buy Me a Coffee"), "https://buymeacoffee.com/dekocosta"),
-            (tr("about_link_kofi", "Support on Ko-fi"), "https://ko-fi.com/dekocosta"),
-            (tr("about_link_livepix", "Livepix (Brazil)"), "https://livepix.gg/dekocosta"),
-        ]
-        
-        for label, url in links:
+        for key, default, url in _ABOUT_LINKS:
             ModernButton(
                 social_card.body,
-                text=label,
-                command=lambda u=url: open_link(u),
+                text=tr(key, default),
+                command=functools.partial(webbrowser.open, url),
                 variant="outline",
                 width=30
             ).pack(pady=(0, Spacing.SM), fill=tk.X)
@@ -2851,21 +2914,7 @@ class EasyCutApp:
         tech_card = ModernCard(main, title=tr("about_section_tech", "Technologies & Credits"), dark_mode=self.dark_mode)
         tech_card.pack(fill=tk.X, pady=(0, Spacing.MD))
         
-        tech_data = [
-            ("Core", "Python 3.13 + Tkinter"),
-            ("Downloader", "yt-dlp (Unlicense)"),
-            ("Converter", "FFmpeg (GPL-2.0+)"),
-            ("Security", "OAuth 2.0"),
-            ("Icons", "Feather Icons (MIT)"),
-            ("Font", "Inter (OFL 1.1)"),
-            ("Image", "Pillow (HPND)")
-        ]
-        
-        for label, value in tech_data:
-            row = ttk.Frame(tech_card.body)
-            row.pack(fill=tk.X, pady=(0, Spacing.XS))
-            ttk.Label(row, text=f"{label}:", style="Subtitle.TLabel", width=12).pack(side=tk.LEFT)
-            ttk.Label(row, text=value, style="Caption.TLabel").pack(side=tk.LEFT)
+        self._build_about_rows(tech_card.body, _ABOUT_TECH)
         
         # === THANKS CARD ===
         thanks_card = ModernCard(main, title=tr("about_section_thanks", "Special Thanks"), dark_mode=self.dark_mode)
@@ -2901,7 +2950,7 @@ class EasyCutApp:
         # Try to use a custom theme base (avoid Windows theme conflicts)
         try:
             style.theme_use("clam")  # Use base theme compatible with customization
-        except:
+        except tk.TclError:
             pass  # If clam not available, continue anyway
         
         self.theme.apply_to_style(style)
@@ -2934,9 +2983,10 @@ class EasyCutApp:
         self.dark_mode = not self.dark_mode
         self.config_manager.set("dark_mode", self.dark_mode)
         set_icon_theme(self.dark_mode)  # Update icon colors
+        reset_icon_cache()
         self.apply_theme()
         self.setup_ui()
-        self.log_app("✓ Theme changed instantly")
+        self.logger.debug("✓ Theme changed instantly")
     
     def change_language(self, lang):
         """Change language with instant reload"""
@@ -2944,7 +2994,7 @@ class EasyCutApp:
             self.language = lang
             self.config_manager.set("language", lang)
             self.setup_ui()
-            self.log_app(f"✓ Language changed to {lang.upper()}")
+            self.logger.debug("✓ Language changed to %s", lang.upper())
     
     def open_login_popup(self):
         """Deprecated: Login popup replaced by browser authentication"""
@@ -3160,7 +3210,7 @@ class EasyCutApp:
                     'skip_download': True
                 })
                 
-                with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+                with _yt_dlp().YoutubeDL(ydl_opts) as ydl:
                     info = ydl.extract_info(test_url, download=False)
                     
                     # Check if we got auth info
@@ -3214,6 +3264,11 @@ class EasyCutApp:
             messagebox.showerror(tr("msg_error", "Error"), tr("download_invalid_url", "Invalid YouTube URL"))
             return
         
+        # Ignore repeated clicks while the same URL is still being fetched
+        if url == self._verifying_url:
+            return
+        self._verifying_url = url
+        
         self.download_log.add_log(tr("meta_fetching", "Fetching video info..."))
         self.format_status_label.config(text=tr("format_fetching", "Fetching available formats..."))
         
@@ -3226,11 +3281,12 @@ class EasyCutApp:
         
         def verify_thread():
             if not YT_DLP_AVAILABLE:
+                self._verifying_url = None
                 self.download_log.add_log(tr("msg_error", "Error") + ": yt-dlp", "ERROR")
                 return
             
             try:
-                with yt_dlp.YoutubeDL({'quiet': True, 'no_warnings': True}) as ydl:
+                with _yt_dlp().YoutubeDL({'quiet': True, 'no_warnings': True}) as ydl:
                     info = ydl.extract_info(url, download=False)
                 
                 # Cache the full info
@@ -3390,6 +3446,9 @@ class EasyCutApp:
                     f"{tr('msg_error', 'Error')}: {str(e)}", "ERROR"
                 ))
                 self.root.after(0, lambda: self.format_status_label.config(text=""))
+            finally:
+                if self._verifying_url == url:
+                    self._verifying_url = None
         
         thread = threading.Thread(target=verify_thread, daemon=True)
         thread.start()
@@ -3417,7 +3476,7 @@ class EasyCutApp:
             
             self.root.after(0, update_ui)
         except Exception as e:
-            self.logger.debug(f"Thumbnail load failed: {e}")
+            self.logger.debug("Thumbnail load failed: %s", e)
     
     def _populate_format_combo(self, formats: list):
         """Populate the format selection combobox with available formats"""
@@ -3728,7 +3787,7 @@ class EasyCutApp:
     def _run_ydl_download(self, url: str, ydl_opts: dict):
         """Run yt-dlp download with a concurrency limit."""
         with self.download_semaphore:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            with _yt_dlp().YoutubeDL(ydl_opts) as ydl:
                 return ydl.extract_info(url, download=True)
     
     def start_download(self):
@@ -3768,8 +3827,8 @@ class EasyCutApp:
         mode = self.download_mode_var.get()
         
         # Structured logging
-        self.logger.info(f"Download started: {url}")
-        self.logger.info(f"  Quality: {quality}, Mode: {mode}")
+        self.logger.info("Download started: %s", url)
+        self.logger.info("  Quality: %s, Mode: %s", quality, mode)
 
         if mode == "audio" and not shutil.which("ffmpeg"):
             messagebox.showerror(
@@ -3852,8 +3911,8 @@ class EasyCutApp:
                 self.config_manager.add_to_history(entry)
                 
                 # Structured logging
-                self.logger.info(f"Download completed: {info.get('title', 'unknown')}")
-                self.logger.info(f"  File: {info.get('_filename', 'unknown')}")
+                self.logger.info("Download completed: %s", info.get('title', 'unknown'))
+                self.logger.info("  File: %s", info.get('_filename', 'unknown'))
 
                 self.download_log.add_log(tr("download_success", "Download completed successfully!"))
                 self.refresh_history()
@@ -3861,8 +3920,8 @@ class EasyCutApp:
             except Exception as e:
                 error_msg = str(e)
                 # Structured logging
-                self.logger.error(f"Download failed: {url}")
-                self.logger.error(f"  Error: {error_msg}")
+                self.logger.error("Download failed: %s", url)
+                self.logger.error("  Error: %s", error_msg)
                 
                 # User-friendly error message
                 friendly = self._get_friendly_error(error_msg)
@@ -3940,7 +3999,7 @@ class EasyCutApp:
             self.config_manager.set("language", self.language)
             self.logger.info("Configuration saved")
         except Exception as e:
-            self.logger.error(f"Error saving configuration: {e}")
+            self.logger.error("Error saving configuration: %s", e)
         
         # Final log
         self.logger.info("EasyCut Application Closed")
@@ -3952,14 +4011,14 @@ class EasyCutApp:
     def start_batch_download(self):
         """Start batch download with queue management"""
         tr = self.translator.get
-        urls_text = self.batch_text.get(1.0, tk.END).strip()
+        # One pass over the text: strip each line once, drop blank ones
+        urls_text = self.batch_text.get("1.0", "end-1c")
+        urls = [url for url in map(str.strip, urls_text.splitlines()) if url]
         
-        if not urls_text:
+        if not urls:
             messagebox.showwarning(tr("msg_warning", "Warning"), tr("batch_empty", "Add at least one URL"))
             return
         
-        urls = [url.strip() for url in urls_text.split('\n') if url.strip()]
-        
         # Get current download mode and quality from UI
         # Use batch-specific quality if available, else fall back to main quality
         if hasattr(self, '_batch_quality_var') and self._batch_quality_var.get():
@@ -4001,8 +4060,8 @@ class EasyCutApp:
         self._refresh_queue_ui()
         
         self.batch_log.add_log(f"{tr('batch_progress', 'Downloading batch')} ({len(urls)})")
-        self.logger.info(f"Batch download started: {len(urls)} URLs")
-        self.logger.info(f"  Quality: {quality}, Mode: {mode}")
+        self.logger.info("Batch download started: %s URLs", len(urls))
+        self.logger.info("  Quality: %s, Mode: %s", quality, mode)
         
         def batch_thread():
             success = 0
@@ -4114,7 +4173,7 @@ class EasyCutApp:
                         break
             
             self.batch_log.add_log(f"Batch complete: {success}/{len(self._download_queue)} successful")
-            self.logger.info(f"Batch download completed: {success}/{len(self._download_queue)} successful")
+            self.logger.info("Batch download completed: %s/%s successful", success, len(self._download_queue))
             self.is_downloading = False
             self.root.after(0, self._refresh_queue_ui)
             self.refresh_history()
@@ -4127,7 +4186,8 @@ class EasyCutApp:
         """Refresh the visual queue list"""
         tr = self.translator.get
         
-        if not hasattr(self, 'queue_list_frame'):
+        # Nothing to draw until the batch section has been built
+        if "batch" in self._section_builders or not hasattr(self, 'queue_list_frame'):
             return
         
         for widget in self.queue_list_frame.winfo_children():
@@ -4227,6 +4287,10 @@ class EasyCutApp:
         """Refresh download history with improved card layout, sorting, and filtering"""
         tr = self.translator.get
         
+        # The history section renders its records itself when first shown
+        if "history" in self._section_builders:
+            return
+        
         # Clear existing records
         for widget in self.history_records_frame.winfo_children():
             widget.destroy()
@@ -4434,7 +4498,7 @@ class EasyCutApp:
                 self._bind_history_context_menu(record_card, item)
                 
             except Exception as e:
-                self.logger.warning(f"Error displaying history record: {e}")
+                self.logger.warning("Error displaying history record: %s", e)
     
     def _load_history_thumbnail(self, label, url: str, video_id: str):
         """Load a thumbnail for a history card asynchronously"""
@@ -4595,7 +4659,7 @@ class EasyCutApp:
                 }
                 ydl_opts = self.get_ydl_opts_with_cookies(opts)
                 
-                with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+                with _yt_dlp().YoutubeDL(ydl_opts) as ydl:
                     ydl.extract_info(url, download=True)
                 
                 self.download_log.add_log(f"🎵 ✅ {tr('pp_audio_done', 'Audio extracted successfully')}")
@@ -4790,7 +4854,7 @@ class EasyCutApp:
                 return
             
             try:
-                with yt_dlp.YoutubeDL({'quiet': True, 'no_warnings': True}) as ydl:
+                with _yt_dlp().YoutubeDL({'quiet': True, 'no_warnings': True}) as ydl:
                     info = ydl.extract_info(url, download=False)
                     is_live = info.get('is_live', False)
                     
@@ -4863,6 +4927,7 @@ class EasyCutApp:
                 else:
                     max_duration = None
                 
+                self._live_last_progress = None
                 base_opts = {
                     'format': format_str,
                     'outtmpl': str(self.output_dir / '%(title)s-%(id)s.%(ext)s'),
@@ -4905,7 +4970,7 @@ class EasyCutApp:
                 
                 ydl_opts = self.get_ydl_opts_with_cookies(base_opts)
                 
-                with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+                with _yt_dlp().YoutubeDL(ydl_opts) as ydl:
                     self.live_log.add_log(tr("download_progress", "Downloading..."))
                     info = ydl.extract_info(url, download=True)
                     filename = ydl.prepare_filename(info)
@@ -4950,6 +5015,16 @@ class EasyCutApp:
     def live_progress_hook(self, d):
         """Progress hook for live recording"""
         if d['status'] == 'downloading':
+            # yt-dlp calls this many times per second — only log when the
+            # whole percent (or, for unknown sizes, the MiB count) changes
+            # yt-dlp may report sizes as floats (e.g. total_bytes_estimate)
+            total = int(d.get('total_bytes') or d.get('total_bytes_estimate') or 0)
+            downloaded = int(d.get('downloaded_bytes') or 0)
+            progress = downloaded * 100 // total if total else downloaded >> 20
+            if progress == getattr(self, '_live_last_progress', None):
+                return
+            self._live_last_progress = progress
+            
             percent = d.get('_percent_str', '0%')
             speed = d.get('_speed_str', '0 B/s')
             eta = d.get('_eta_str', 'Unknown')
@@ -4967,6 +5042,19 @@ class EasyCutApp:
         elif event.num == 4 or event.delta > 0:  # Scroll up
             canvas.yview_scroll(-3, "units")
     
+    def _on_global_mousewheel(self, event):
+        """Application-wide wheel handler: scroll the canvas under the pointer"""
+        canvas = self.active_scroll_canvas
+        if canvas is None:
+            return
+        try:
+            self._on_mousewheel(event, canvas)
+        except tk.TclError:
+            # Canvas was destroyed by a UI rebuild without a <Leave>
+            self.active_scroll_canvas = None
+            return
+        return "break"  # Prevent event propagation
+    
     def enable_mousewheel_scroll(self, canvas, frame=None):
         """Enable mouse wheel scrolling for a canvas anywhere within its area
         
@@ -4974,11 +5062,6 @@ class EasyCutApp:
             canvas: Canvas widget to enable scrolling for
             frame: Optional parent frame to also bind scroll events (recursively to all children)
         """
-        # Store canvas reference for later use
-        if not hasattr(self, '_scroll_canvases'):
-            self._scroll_canvases = []
-        self._scroll_canvases.append(canvas)
-        
         # Track mouse entering/leaving canvas area for global scroll handling
         def on_canvas_enter(e):
             self.active_scroll_canvas = canvas
@@ -4992,16 +5075,11 @@ class EasyCutApp:
         canvas.bind("<Enter>", on_canvas_enter)
         canvas.bind("<Leave>", on_canvas_leave)
         
-        # Use bind_all with a check to only scroll the active canvas
-        # This captures events even when over child widgets
-        def scroll_handler(event):
-            # Only scroll if mouse is over this canvas
-            if self.active_scroll_canvas is canvas:
-                self._on_mousewheel(event, canvas)
-                return "break"  # Prevent event propagation
-        
-        # Bind at application level but check if over our canvas
-        canvas.bind_all("<MouseWheel>", scroll_handler, "+")
-        canvas.bind_all("<Button-4>", scroll_handler, "+")
-        canvas.bind_all("<Button-5>", scroll_handler, "+")
+        # A single bind_all serves every canvas (it captures events even over
+        # child widgets), so it is registered once instead of once per canvas.
+        # Bound through root so the Tcl callback survives setup_ui rebuilds.
+        if not self._mousewheel_bound:
+            for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+                self.root.bind_all(sequence, self._on_global_mousewheel)
+            self._mousewheel_bound = True
 
@@ -39,7 +39,7 @@ def load_custom_fonts():
         fonts_dir = base_path / "assets" / "fonts" / "Inter" / "extras" / "ttf"
         
         if not fonts_dir.exists():
-            logger.warning(f"Fonts directory not found: {fonts_dir}")
+            logger.warning("Fonts directory not found: %s", fonts_dir)
             return False
         
         # On Windows, use GDI to load fonts temporarily
@@ -70,12 +70,12 @@ def load_custom_fonts():
                     )
                     if result > 0:
                         fonts_loaded += 1
-                        logger.info(f"✓ Loaded font: {font_file}")
+                        logger.info("✓ Loaded font: %s", font_file)
                     else:
-                        logger.warning(f"✗ Failed to load font: {font_file}")
+                        logger.warning("✗ Failed to load font: %s", font_file)
             
             if fonts_loaded > 0:
-                logger.info(f"Successfully loaded {fonts_loaded} Inter fonts")
+                logger.info("Successfully loaded %s Inter fonts", fonts_loaded)
                 return True
             else:
                 logger.warning("No Inter fonts could be loaded")
@@ -87,7 +87,7 @@ def load_custom_fonts():
             return False
             
     except Exception as e:
-        logger.error(f"Error loading custom fonts: {e}")
+        logger.error("Error loading custom fonts: %s", e)
         return False
 
 
@@ -113,23 +113,23 @@ def get_available_font(preferred="Inter", fallback="Segoe UI"):
         inter_fonts = [f for f in available_fonts if 'inter' in f.lower()]
         if inter_fonts:
             font_name = inter_fonts[0]
-            logger.info(f"Using Inter font: {font_name}")
+            logger.info("Using Inter font: %s", font_name)
             root.destroy()
             return font_name
         
         # Check if preferred font is available
         if preferred in available_fonts:
-            logger.info(f"Using preferred font: {preferred}")
+            logger.info("Using preferred font: %s", preferred)
             root.destroy()
             return preferred
         
         # Use fallback
-        logger.info(f"Using fallback font: {fallback}")
+        logger.info("Using fallback font: %s", fallback)
         root.destroy()
         return fallback
         
     except Exception as e:
-        logger.error(f"Error checking fonts: {e}")
+        logger.error("Error checking fonts: %s", e)
         return fallback
 
 
@@ -154,5 +154,5 @@ def setup_fonts():
     # Update global variable
     LOADED_FONT_FAMILY = font_name
     
-    logger.info(f"Using font: {font_name}")
+    logger.info("Using font: %s", font_name)
     return font_name
@@ -150,6 +150,7 @@ TRANSLATIONS = {
         "download_until_time": "Until Time (MM:SS)",
         "download_quality": "Quality/Format",
         "audio_format": "Audio Format",
+        "audio_format_label": "Format",
         "audio_bitrate": "Bitrate",
         "download_quality_best": "Best Quality",
         "download_subtitle": "Download videos and audio from YouTube",
@@ -674,6 +675,7 @@ TRANSLATIONS = {
         "download_until_time": "Até o Tempo (MM:SS)",
         "download_quality": "Qualidade/Formato",
         "audio_format": "Formato de Áudio",
+        "audio_format_label": "Formato",
         "audio_bitrate": "Taxa de Bits",
         "download_quality_best": "Melhor Qualidade",
         "download_subtitle": "Baixe vídeos e áudio do YouTube",
@@ -1183,6 +1185,7 @@ TRANSLATIONS = {
         "download_until_time": "Hasta el tiempo (MM:SS)",
         "download_quality": "Calidad/Formato",
         "audio_format": "Formato de audio",
+        "audio_format_label": "Formato",
         "audio_bitrate": "Tasa de bits",
         "download_quality_best": "Mejor calidad",
         "download_subtitle": "Descarga videos y audio de YouTube",
@@ -1633,6 +1636,7 @@ TRANSLATIONS = {
         "download_until_time": "Jusqu'au temps (MM:SS)",
         "download_quality": "Qualité/Format",
         "audio_format": "Format audio",
+        "audio_format_label": "Format",
         "audio_bitrate": "Débit",
         "download_quality_best": "Meilleure qualité",
         "download_subtitle": "Téléchargez des vidéos et de l'audio depuis YouTube",
@@ -2083,6 +2087,7 @@ TRANSLATIONS = {
         "download_until_time": "Bis zur Zeit (MM:SS)",
         "download_quality": "Qualität/Format",
         "audio_format": "Audioformat",
+        "audio_format_label": "Format",
         "audio_bitrate": "Bitrate",
         "download_quality_best": "Beste Qualität",
         "download_subtitle": "Videos und Audio von YouTube herunterladen",
@@ -2533,6 +2538,7 @@ TRANSLATIONS = {
         "download_until_time": "Fino a (MM:SS)",
         "download_quality": "Qualità/Formato",
         "audio_format": "Formato audio",
+        "audio_format_label": "Formato",
         "audio_bitrate": "Bitrate",
         "download_quality_best": "Migliore qualità",
         "download_subtitle": "Scarica video e audio da YouTube",
@@ -2983,6 +2989,7 @@ TRANSLATIONS = {
         "download_until_time": "指定時間まで（MM:SS）",
         "download_quality": "品質/形式",
         "audio_format": "音声形式",
+        "audio_format_label": "形式",
         "audio_bitrate": "ビットレート",
         "download_quality_best": "最高品質",
         "download_subtitle": "YouTubeから動画と音声をダウンロード",
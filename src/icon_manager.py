@@ -2,6 +2,8 @@
 Icon Manager - Carrega ícones Feather e outros assets
 Versão simplificada usando apenas emojis/unicode como fallback
 """
+import functools
+import hashlib
 from pathlib import Path
 from tkinter import PhotoImage
 from PIL import Image, ImageTk, ImageDraw, ImageFont
@@ -147,7 +149,7 @@ class IconManager:
                 try:
                     font = ImageFont.truetype(font_name, font_size)
                     break
-                except:
+                except OSError:
                     continue
             
             # Fallback para fonte padrão
@@ -164,8 +166,8 @@ class IconManager:
                     (size - text_width) // 2 - bbox[0],
                     (size - text_height) // 2 - bbox[1]
                 )
-            except:
-                # Fallback se textbbox não funcionar
+            except (AttributeError, TypeError, ValueError):
+                # Fallback se textbbox não funcionar (Pillow antigo)
                 position = (size // 4, size // 4)
             
             # Desenhar com cor do tema (ou padrão)
@@ -174,7 +176,7 @@ class IconManager:
                 try:
                     c = color.lstrip('#')
                     fill_color = tuple(int(c[i:i+2], 16) for i in (0, 2, 4)) + (255,)
-                except:
+                except ValueError:
                     fill_color = (150, 150, 150, 255)
             else:
                 fill_color = (150, 150, 150, 255)
@@ -190,7 +192,7 @@ class IconManager:
                 img = Image.new('RGBA', (size, size), (100, 100, 100, 255))
                 photo = ImageTk.PhotoImage(img)
                 return photo
-            except:
+            except Exception:
                 return None
     
 
@@ -258,6 +260,16 @@ def set_icon_theme(dark_mode: bool):
     icon_manager.cache.clear()
 
 
+@functools.lru_cache(maxsize=2)
+def _theme_icon_color(is_dark: bool) -> str:
+    """Cor padrão dos ícones por tema (DesignTokens só é criado uma vez por modo)"""
+    try:
+        from design_system import DesignTokens
+    except ImportError:
+        return None
+    return DesignTokens(dark_mode=is_dark).get_color("icon_primary")
+
+
 def get_ui_icon(icon_key: str, size: int = 16, color: str = None, theme: str = None) -> PhotoImage:
     """
     Atalho para pegar ícone mapeado da UI com cores inteligentes
@@ -275,12 +287,96 @@ def get_ui_icon(icon_key: str, size: int = 16, color: str = None, theme: str = N
     
     # Se não teve cor e tema especificado, usar cor padrão do tema atual
     if not color:
+        is_dark = _current_dark_mode if theme is None else (theme == "dark")
+        color = _theme_icon_color(bool(is_dark))
+    
+    return icon_manager.get_icon(feather_name, size, color)
+
+
+# Cache de emojis renderizados (memória + disco)
+EMOJI_CACHE_DIR = Path.home() / ".cache" / "easycut" / "emoji"
+_emoji_cache = {}
+
+
+@functools.lru_cache(maxsize=16)
+def _emoji_font(font_size: int):
+    """Localiza a fonte de emoji do sistema (ou None se indisponível)"""
+    for font_name in ("seguiemj.ttf", "C:\\Windows\\Fonts\\seguiemj.ttf"):
         try:
-            from design_system import DesignTokens
-            is_dark = _current_dark_mode if theme is None else (theme == "dark")
-            tokens = DesignTokens(dark_mode=is_dark)
-            color = tokens.get_color("icon_primary")
-        except:
+            return ImageFont.truetype(font_name, font_size)
+        except OSError:
+            continue
+    return None
+
+
+def _draw_emoji(ch: str, size: int, fg: str = None):
+    """Desenha o emoji centralizado em uma imagem RGBA quadrada"""
+    font = _emoji_font(int(size * 0.8))
+    if font is None:
+        return None
+    
+    img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(img)
+    
+    bbox = draw.textbbox((0, 0), ch, font=font, embedded_color=True)
+    position = (
+        (size - (bbox[2] - bbox[0])) // 2 - bbox[0],
+        (size - (bbox[3] - bbox[1])) // 2 - bbox[1]
+    )
+    
+    fill_color = (150, 150, 150, 255)
+    if fg:
+        try:
+            c = fg.lstrip('#')
+            fill_color = tuple(int(c[i:i+2], 16) for i in (0, 2, 4)) + (255,)
+        except ValueError:
             pass
     
-    return icon_manager.get_icon(feather_name, size, color)
+    draw.text(position, ch, font=font, fill=fill_color, embedded_color=True)
+    return img
+
+
+def render_emoji(ch: str, size: int = 16, fg: str = None) -> PhotoImage:
+    """
+    Renderiza um emoji como PhotoImage, com cache em memória e em disco
+    
+    Evita que o Tk rasterize o glifo de novo a cada Label criado.
+    
+    Args:
+        ch: Emoji a renderizar (ex: "✅")
+        size: Tamanho em pixels
+        fg: Cor em hex para glifos monocromáticos - opcional
+    
+    Returns:
+        PhotoImage ou None se nenhuma fonte de emoji estiver disponível
+    """
+    key = (ch, size, fg)
+    # Falhas também ficam em cache (None), para não repetir hash, disco e
+    # renderização quando não há fonte de emoji (fora do Windows)
+    if key in _emoji_cache:
+        return _emoji_cache[key]
+    
+    digest = hashlib.md5(f"{ch}|{size}|{fg}".encode("utf-8")).hexdigest()
+    png_path = EMOJI_CACHE_DIR / f"{digest}.png"
+    
+    photo = None
+    try:
+        if png_path.exists():
+            # load() lê os pixels e fecha o arquivo ao sair do with
+            with Image.open(png_path) as img:
+                img.load()
+        else:
+            img = _draw_emoji(ch, size, fg)
+            if img is not None:
+                try:
+                    EMOJI_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                    img.save(png_path)
+                except OSError:
+                    pass  # Cache em disco é opcional
+        if img is not None:
+            photo = ImageTk.PhotoImage(img)
+    except Exception:
+        photo = None
+    
+    _emoji_cache[key] = photo
+    return photo
@@ -7,12 +7,21 @@ Repository: https://github.com/dekouninter/EasyCut
 Version: 1.4.0
 """
 
+import collections
+import dataclasses
+import functools
+import heapq
+import itertools
+import time
+import types
 import tkinter as tk
 from tkinter import ttk
+from tkinter import font as tkfont
 
 from design_system import DesignTokens, Typography, Spacing, Icons
-from icon_manager import get_ui_icon
-from font_loader import LOADED_FONT_FAMILY
+
+# icon_manager pulls in Pillow — resolved on first icon use (see _icon_mod)
+_icon_manager = None
 
 # ════════════════════════════════════════════════
 # EMOJI FALLBACK MAP
@@ -76,6 +85,112 @@ EMOJI_ICONS = {
     "minimize": "▬",
 }
 
+# Button text prefixes, built once instead of per button
+EMOJI_WITH_SPACE = {k: f"{v} " for k, v in EMOJI_ICONS.items()}
+EMOJI_ICONS = types.MappingProxyType(EMOJI_ICONS)
+
+
+# ════════════════════════════════════════════════
+# ICON CACHE
+# ════════════════════════════════════════════════
+
+def _icon_mod():
+    """Import icon_manager lazily so icon-free widgets skip Pillow entirely"""
+    global _icon_manager
+    if _icon_manager is None:
+        import icon_manager
+        _icon_manager = icon_manager
+    return _icon_manager
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_ui_icon(icon_name, size, root_id):
+    """Decode a UI icon once per (name, size) for a given Tk interpreter"""
+    try:
+        return _icon_mod().get_ui_icon(icon_name, size=size)
+    except Exception:
+        return None  # Cached too — a missing icon is only looked up once
+
+
+def _ui_icon(icon_name, size):
+    """Cached icon lookup, None on miss — PhotoImages are only valid in the root that made them"""
+    return _cached_ui_icon(icon_name, size, id(tk._default_root))
+
+
+def reset_icon_cache():
+    """Drop cached icons (call on theme change — icon colors follow the theme)"""
+    _cached_ui_icon.cache_clear()
+
+
+# ════════════════════════════════════════════════
+# DESIGN TOKEN CACHE
+# ════════════════════════════════════════════════
+
+_DESIGN_CACHE = {}
+
+
+def _design(dark_mode):
+    """Shared DesignTokens per theme mode — widgets only read from them"""
+    dark_mode = bool(dark_mode)
+    tokens = _DESIGN_CACHE.get(dark_mode)
+    if tokens is None:
+        tokens = _DESIGN_CACHE[dark_mode] = DesignTokens(dark_mode=dark_mode)
+    return tokens
+
+
+# Attribute access instead of get_color("...") string lookups per widget
+_Palette = collections.namedtuple("_Palette", (
+    "bg_primary", "bg_tertiary", "bg_elevated",
+    "fg_primary", "fg_secondary", "fg_tertiary",
+    "border", "border_hover", "accent_primary",
+))
+
+_PALETTE_CACHE = {}
+
+
+def _palette(dark_mode):
+    """Snapshot of the common widget colors per theme mode"""
+    dark_mode = bool(dark_mode)
+    pal = _PALETTE_CACHE.get(dark_mode)
+    if pal is None:
+        design = _design(dark_mode)
+        pal = _PALETTE_CACHE[dark_mode] = _Palette._make(
+            design.get_color(key) for key in _Palette._fields
+        )
+    return pal
+
+
+# ════════════════════════════════════════════════
+# FONTS — one named Tk font per spec, shared by every widget
+# ════════════════════════════════════════════════
+
+_FF = Typography.FONT_FAMILY
+_FONT_H1_BOLD = (_FF, Typography.SIZE_H1, "bold")
+_FONT_H3_BOLD = (_FF, Typography.SIZE_H3, "bold")
+_FONT_BODY_BOLD = (_FF, Typography.SIZE_BODY, "bold")
+_FONT_CAPTION = (_FF, Typography.SIZE_CAPTION)
+_FONT_TINY_BOLD = (_FF, Typography.SIZE_TINY, "bold")
+_FONT_DISMISS = (_FF, 10)
+_FONT_EMOJI = (Typography.FONT_EMOJI, 12)
+
+_FONT_CACHE = {}
+
+
+def _font(spec):
+    """Shared tkfont.Font per (root, spec) so Tk resolves each font only once"""
+    root = tk._default_root
+    if root is None:
+        return spec
+    key = (root, spec)
+    font = _FONT_CACHE.get(key)
+    if font is None:
+        family, size, *weight = spec
+        font = _FONT_CACHE[key] = tkfont.Font(
+            root=root, family=family, size=size,
+            weight=weight[0] if weight else "normal"
+        )
+    return font
+
 
 # ════════════════════════════════════════════════
 # MODERN BUTTON
@@ -107,23 +222,13 @@ class ModernButton(ttk.Button):
         
         if icon_name:
             icon_size = Icons.SIZE_SM if size == "sm" else Icons.SIZE_MD
-            try:
-                self.icon = get_ui_icon(icon_name, size=icon_size)
-            except Exception:
-                self.icon = None
-            
-            if not self.icon and icon_name in EMOJI_ICONS:
-                emoji_prefix = EMOJI_ICONS[icon_name] + " "
+            self.icon = _ui_icon(icon_name, icon_size)
+            if not self.icon:
+                emoji_prefix = EMOJI_WITH_SPACE.get(icon_name, "")
         
-        # Resolve style
-        base_style = self.VARIANTS.get(variant, "TButton")
-        style = base_style
+        style = self.STYLE_TABLE.get((variant, size), "TButton")
         
-        size_style = self.SIZE_STYLES.get(size)
-        if size_style and variant == "primary":
-            style = size_style
-        
-        button_text = f"{emoji_prefix}{text}"
+        button_text = emoji_prefix + text if emoji_prefix else text
         
         super().__init__(
             parent,
@@ -140,6 +245,15 @@ class ModernButton(ttk.Button):
             self.image = self.icon
 
 
+# Final style per (variant, size), derived from the two tables above so they
+# stay the single source of truth — sizes only restyle primary buttons
+ModernButton.STYLE_TABLE = {
+    (variant, size): size_style if (size_style and variant == "primary") else base
+    for variant, base in ModernButton.VARIANTS.items()
+    for size, size_style in ModernButton.SIZE_STYLES.items()
+}
+
+
 # ════════════════════════════════════════════════
 # SECTION HEADER — Page title with accent underline
 # ════════════════════════════════════════════════
@@ -148,19 +262,20 @@ class SectionHeader(tk.Frame):
     """Section header with title, subtitle, and accent underline"""
     
     def __init__(self, parent, title="", subtitle="", dark_mode=True, **kwargs):
-        self._design = DesignTokens(dark_mode=dark_mode)
-        bg = self._design.get_color("bg_primary")
+        self._design = _design(dark_mode)
+        c = _palette(dark_mode)
+        bg = c.bg_primary
         
         super().__init__(parent, bg=bg, **kwargs)
         
-        fg = self._design.get_color("fg_primary")
-        fg_sec = self._design.get_color("fg_secondary")
-        accent = self._design.get_color("accent_primary")
+        fg = c.fg_primary
+        fg_sec = c.fg_secondary
+        accent = c.accent_primary
         
         # Title
         tk.Label(
             self, text=title, bg=bg, fg=fg,
-            font=(Typography.FONT_FAMILY, Typography.SIZE_H1, "bold"),
+            font=_font(_FONT_H1_BOLD),
             anchor="w"
         ).pack(fill=tk.X)
         
@@ -168,7 +283,7 @@ class SectionHeader(tk.Frame):
         if subtitle:
             tk.Label(
                 self, text=subtitle, bg=bg, fg=fg_sec,
-                font=(Typography.FONT_FAMILY, Typography.SIZE_CAPTION),
+                font=_font(_FONT_CAPTION),
                 anchor="w"
             ).pack(fill=tk.X, pady=(2, 0))
         
@@ -191,12 +306,11 @@ class ModernCard(tk.Frame):
                  dark_mode=None, accent_color=None, **kwargs):
         if dark_mode is None:
             dark_mode = True
-        self._design = DesignTokens(dark_mode=dark_mode)
+        self._design = _design(dark_mode)
+        c = _palette(dark_mode)
+        bg = c.bg_tertiary
         
-        bg = self._design.get_color("bg_tertiary")
-        border_color = self._design.get_color("border")
-        
-        super().__init__(parent, bg=bg, highlightbackground=border_color,
+        super().__init__(parent, bg=bg, highlightbackground=c.border,
                          highlightthickness=1, **kwargs)
         
         # Accent top border (colored strip at top of card)
@@ -208,21 +322,21 @@ class ModernCard(tk.Frame):
         self._inner.pack(fill=tk.BOTH, expand=True, padx=pad, pady=pad)
         
         if title:
-            fg = self._design.get_color("fg_primary")
+            fg = c.fg_primary
             title_frame = tk.Frame(self._inner, bg=bg)
             title_frame.pack(fill=tk.X, pady=(0, Spacing.SM))
             
             tk.Label(
                 title_frame, text=title, bg=bg, fg=fg,
-                font=(Typography.FONT_FAMILY, Typography.SIZE_H3, "bold"),
+                font=_font(_FONT_H3_BOLD),
                 anchor="w"
             ).pack(side=tk.LEFT, fill=tk.X)
         
         if subtitle:
-            fg_sec = self._design.get_color("fg_secondary")
+            fg_sec = c.fg_secondary
             tk.Label(
                 self._inner, text=subtitle, bg=bg, fg=fg_sec,
-                font=(Typography.FONT_FAMILY, Typography.SIZE_CAPTION),
+                font=_font(_FONT_CAPTION),
                 anchor="w"
             ).pack(fill=tk.X, pady=(0, Spacing.SM))
     
@@ -236,7 +350,28 @@ class ModernCard(tk.Frame):
 # STATUS DOT — Colored indicator dot
 # ════════════════════════════════════════════════
 
-class StatusDot(tk.Canvas):
+_DOT_IMAGES = {}
+
+
+def _dot_image(root, color, size):
+    """Circle PhotoImage per (root, color, size), drawn once as row spans"""
+    key = (root, color, size)
+    img = _DOT_IMAGES.get(key)
+    if img is None:
+        img = _DOT_IMAGES[key] = tk.PhotoImage(master=root, width=size, height=size)
+        # Same 1px inset as the old canvas oval; unset pixels stay transparent
+        r = (size - 2) / 2
+        c = size / 2
+        for y in range(1, size - 1):
+            dy = y + 0.5 - c
+            half = (r * r - dy * dy) ** 0.5 if abs(dy) < r else 0
+            x0, x1 = round(c - half), round(c + half)
+            if x1 > x0:
+                img.put(color, to=(x0, y, x1, y + 1))
+    return img
+
+
+class StatusDot(tk.Label):
     """Small colored dot indicator (e.g., online/offline/busy)"""
     
     COLORS = {
@@ -249,38 +384,107 @@ class StatusDot(tk.Canvas):
     }
     
     def __init__(self, parent, status="offline", size=10, dark_mode=None, **kwargs):
-        super().__init__(parent, width=size, height=size,
-                         highlightthickness=0, **kwargs)
+        super().__init__(parent, bd=0, highlightthickness=0,
+                         padx=0, pady=0, **kwargs)
         self._size = size
         self.set_status(status)
     
     def set_status(self, status):
         """Update dot color by status name or hex color"""
         color = self.COLORS.get(status, status)
-        self.delete("all")
-        pad = 1
-        self.create_oval(pad, pad, self._size - pad, self._size - pad,
-                         fill=color, outline="")
+        self.configure(image=_dot_image(self._root(), color, self._size))
 
 
 # ════════════════════════════════════════════════
 # TOOLTIP — Hover tooltip for any widget
 # ════════════════════════════════════════════════
 
+class _TooltipWindow:
+    """Single hidden Toplevel shared by every Tooltip of a Tk root"""
+    
+    _instances = {}
+    
+    def __init__(self, root):
+        self.window = tk.Toplevel(root)
+        self.window.withdraw()
+        self.window.wm_overrideredirect(True)
+        
+        self.frame = tk.Frame(self.window, highlightthickness=1)
+        self.frame.pack()
+        
+        self.label = tk.Label(
+            self.frame,
+            font=_font(_FONT_CAPTION),
+            padx=Spacing.SM, pady=Spacing.XS,
+            justify=tk.LEFT, wraplength=250
+        )
+        self.label.pack()
+        
+        self.owner = None  # Tooltip currently shown
+    
+    @classmethod
+    def get(cls, widget):
+        """Return the tooltip window for the widget's root, creating it lazily"""
+        root = widget._root()
+        inst = cls._instances.get(root)
+        # setup_ui() destroys every root child on theme/language reload
+        if inst is None or not inst.window.winfo_exists():
+            inst = cls._instances[root] = cls(root)
+        return inst
+    
+    def show_at(self, owner, x, y, text, bg, fg, border):
+        self.owner = owner
+        self.frame.configure(bg=bg, highlightbackground=border)
+        self.label.configure(text=text, bg=bg, fg=fg)
+        self.window.wm_geometry(f"+{x}+{y}")
+        self.window.deiconify()
+        self.window.lift()
+    
+    def hide(self, owner):
+        """Withdraw — only if the caller still owns the window"""
+        if self.owner is owner:
+            self.owner = None
+            self.window.withdraw()
+
+
+_TOOLTIP_TAG = "EasyCutTooltip"
+
+
+def _tooltip_enter(event):
+    tip = getattr(event.widget, "_tooltip", None)
+    if tip is not None:
+        tip._schedule()
+
+
+def _tooltip_cancel(event):
+    tip = getattr(event.widget, "_tooltip", None)
+    if tip is not None:
+        tip._cancel()
+
+
 class Tooltip:
     """Hover tooltip that appears near a widget"""
     
+    __slots__ = ("widget", "text", "delay", "_colors", "_tip_window", "_timer")
+    
     def __init__(self, widget, text, delay=500, dark_mode=True):
         self.widget = widget
         self.text = text
         self.delay = delay
-        self._design = DesignTokens(dark_mode=dark_mode)
+        self._colors = _palette(dark_mode)
         self._tip_window = None
         self._timer = None
         
-        widget.bind("<Enter>", self._schedule, add="+")
-        widget.bind("<Leave>", self._cancel, add="+")
-        widget.bind("<ButtonPress>", self._cancel, add="+")
+        # One class binding serves every tooltip — no per-widget handlers
+        if not widget.bind_class(_TOOLTIP_TAG):
+            widget.bind_class(_TOOLTIP_TAG, "<Enter>", _tooltip_enter)
+            widget.bind_class(_TOOLTIP_TAG, "<Leave>", _tooltip_cancel)
+            widget.bind_class(_TOOLTIP_TAG, "<ButtonPress>", _tooltip_cancel)
+        
+        widget._tooltip = self
+        tags = widget.bindtags()
+        if _TOOLTIP_TAG not in tags:
+            widget.bindtags((tags[0], _TOOLTIP_TAG) + tags[1:])
     
     def _schedule(self, event=None):
         self._cancel()
@@ -299,29 +503,17 @@ class Tooltip:
         x = self.widget.winfo_rootx() + 20
         y = self.widget.winfo_rooty() + self.widget.winfo_height() + 5
         
-        bg = self._design.get_color("bg_elevated")
-        fg = self._design.get_color("fg_primary")
-        border = self._design.get_color("border_hover")
-        
-        self._tip_window = tw = tk.Toplevel(self.widget)
-        tw.wm_overrideredirect(True)
-        tw.wm_geometry(f"+{x}+{y}")
-        
-        # Tooltip frame
-        frame = tk.Frame(tw, bg=bg, highlightbackground=border,
-                         highlightthickness=1)
-        frame.pack()
-        
-        tk.Label(
-            frame, text=self.text, bg=bg, fg=fg,
-            font=(Typography.FONT_FAMILY, Typography.SIZE_CAPTION),
-            padx=Spacing.SM, pady=Spacing.XS,
-            justify=tk.LEFT, wraplength=250
-        ).pack()
+        self._tip_window = _TooltipWindow.get(self.widget)
+        self._tip_window.show_at(
+            self, x, y, self.text,
+            bg=self._colors.bg_elevated,
+            fg=self._colors.fg_primary,
+            border=self._colors.border_hover,
+        )
     
     def _hide(self):
         if self._tip_window:
-            self._tip_window.destroy()
+            self._tip_window.hide(self)
             self._tip_window = None
 
 
@@ -342,17 +534,22 @@ class Badge(tk.Label):
     }
     
     def __init__(self, parent, text="", preset="neutral", **kwargs):
-        colors = self.PRESETS.get(preset, self.PRESETS["neutral"])
+        bg, fg = _BADGE_COLORS.get(preset) or _BADGE_COLORS["neutral"]
         
+        # Horizontal padding replaces the old "  text  " space padding
         super().__init__(
-            parent, text=f"  {text}  ",
-            bg=colors["bg"], fg=colors["fg"],
-            font=(Typography.FONT_FAMILY, Typography.SIZE_TINY, "bold"),
-            padx=Spacing.SM, pady=2,
+            parent, text=text,
+            bg=bg, fg=fg,
+            font=_font(_FONT_TINY_BOLD),
+            padx=Spacing.MD, pady=2,
             **kwargs
         )
 
 
+# Presets resolved to (bg, fg) once
+_BADGE_COLORS = {k: (v["bg"], v["fg"]) for k, v in Badge.PRESETS.items()}
+
+
 # ════════════════════════════════════════════════
 # DIVIDER — Horizontal divider with optional label
 # ════════════════════════════════════════════════
@@ -361,35 +558,91 @@ class Divider(tk.Frame):
     """Horizontal divider line with optional centered label"""
     
     def __init__(self, parent, text=None, dark_mode=True, **kwargs):
-        self._design = DesignTokens(dark_mode=dark_mode)
-        bg = self._design.get_color("bg_primary")
-        border = self._design.get_color("border")
+        self._design = _design(dark_mode)
+        c = _palette(dark_mode)
+        bg = c.bg_primary
+        border = c.border
+        
+        if not text:
+            # The frame itself is the line — pack with pady for spacing
+            kwargs.setdefault("height", 1)
+            super().__init__(parent, bg=border, **kwargs)
+            return
         
         super().__init__(parent, bg=bg, **kwargs)
         
-        if text:
-            fg_sec = self._design.get_color("fg_tertiary")
-            # Line — label — line
-            tk.Frame(self, bg=border, height=1).pack(
-                side=tk.LEFT, fill=tk.X, expand=True, pady=Spacing.SM
-            )
-            tk.Label(
-                self, text=f"  {text}  ", bg=bg, fg=fg_sec,
-                font=(Typography.FONT_FAMILY, Typography.SIZE_CAPTION)
-            ).pack(side=tk.LEFT)
-            tk.Frame(self, bg=border, height=1).pack(
-                side=tk.LEFT, fill=tk.X, expand=True, pady=Spacing.SM
-            )
-        else:
-            tk.Frame(self, bg=border, height=1).pack(
-                fill=tk.X, pady=Spacing.SM
-            )
+        # Line — label — line
+        tk.Frame(self, bg=border, height=1).pack(
+            side=tk.LEFT, fill=tk.X, expand=True, pady=Spacing.SM
+        )
+        tk.Label(
+            self, text=f"  {text}  ", bg=bg, fg=c.fg_tertiary,
+            font=_font(_FONT_CAPTION)
+        ).pack(side=tk.LEFT)
+        tk.Frame(self, bg=border, height=1).pack(
+            side=tk.LEFT, fill=tk.X, expand=True, pady=Spacing.SM
+        )
 
 
 # ════════════════════════════════════════════════
 # TOAST — Notification system
 # ════════════════════════════════════════════════
 
+@dataclasses.dataclass(frozen=True)
+class ToastPalette:
+    """Toast colors for one theme mode, resolved once"""
+    __slots__ = ("bg", "border", "fg", "fg_sec", "accents")
+    bg: str
+    border: str
+    fg: str
+    fg_sec: str
+    accents: types.MappingProxyType
+    
+    @classmethod
+    def build(cls, design):
+        keys = ("success", "warning", "error", "info")
+        return cls(
+            bg=design.get_color("bg_elevated"),
+            border=design.get_color("border_hover"),
+            fg=design.get_color("fg_primary"),
+            fg_sec=design.get_color("fg_secondary"),
+            accents=types.MappingProxyType({k: design.get_color(k) for k in keys}),
+        )
+
+
+_TOAST_PALETTES = {}
+
+
+def _toast_palette(dark_mode):
+    """Cached ToastPalette per theme mode"""
+    dark_mode = bool(dark_mode)
+    pal = _TOAST_PALETTES.get(dark_mode)
+    if pal is None:
+        pal = _TOAST_PALETTES[dark_mode] = ToastPalette.build(_design(dark_mode))
+    return pal
+
+
+_ToastStyle = collections.namedtuple(
+    "_ToastStyle", ("bg", "border", "accent", "fg", "fg_sec", "emoji")
+)
+
+_TOAST_STYLES = {}
+
+
+def _toast_style(dark_mode, variant):
+    """Everything a Toast needs for one (theme mode, variant) — 8 combinations"""
+    key = (bool(dark_mode), variant)
+    style = _TOAST_STYLES.get(key)
+    if style is None:
+        pal = _toast_palette(key[0])
+        vdata = Toast.VARIANTS.get(variant, Toast.VARIANTS["info"])
+        style = _TOAST_STYLES[key] = _ToastStyle(
+            pal.bg, pal.border, pal.accents[vdata["color_key"]],
+            pal.fg, pal.fg_sec, vdata["emoji"]
+        )
+    return style
+
+
 class Toast(tk.Frame):
     """Single toast notification"""
     
@@ -401,54 +654,57 @@ class Toast(tk.Frame):
     }
     
     def __init__(self, parent, title="", message="", variant="info", 
-                 duration=4000, dark_mode=True, on_dismiss=None, **kwargs):
-        self._design = DesignTokens(dark_mode=dark_mode)
-        bg = self._design.get_color("bg_elevated")
-        border_color = self._design.get_color("border_hover")
+                 duration=4000, dark_mode=True, on_dismiss=None,
+                 emoji_image=None, **kwargs):
+        bg, border, accent, fg, fg_sec, emoji = _toast_style(dark_mode, variant)
         
-        super().__init__(parent, bg=bg, highlightbackground=border_color,
+        super().__init__(parent, bg=bg, highlightbackground=border,
                          highlightthickness=1, **kwargs)
         
-        vdata = self.VARIANTS.get(variant, self.VARIANTS["info"])
-        accent = self._design.get_color(vdata["color_key"])
-        fg = self._design.get_color("fg_primary")
-        fg_sec = self._design.get_color("fg_secondary")
+        # One grid on the toast itself — no nested content/top frames
+        self.grid_columnconfigure(2, weight=1)
+        row0_pady = (Spacing.SM, 0) if message else Spacing.SM
         
         # Left color bar (accent stripe)
-        tk.Frame(self, width=4, bg=accent).pack(side=tk.LEFT, fill=tk.Y)
-        
-        content = tk.Frame(self, bg=bg)
-        content.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=Spacing.MD, pady=Spacing.SM)
+        tk.Frame(self, width=4, bg=accent).grid(
+            row=0, column=0, rowspan=2, sticky="ns"
+        )
         
         # Top row: emoji + title + dismiss
-        top = tk.Frame(content, bg=bg)
-        top.pack(fill=tk.X)
-        
-        tk.Label(
-            top, text=vdata["emoji"], bg=bg,
-            font=(Typography.FONT_EMOJI, 12)
-        ).pack(side=tk.LEFT, padx=(0, Spacing.SM))
+        if emoji_image is None:
+            emoji_image = _icon_mod().render_emoji(emoji, 16, fg)
+        if emoji_image:
+            emoji_label = tk.Label(self, image=emoji_image, bg=bg)
+            emoji_label.image = emoji_image
+        else:
+            emoji_label = tk.Label(
+                self, text=emoji, bg=bg,
+                font=_font(_FONT_EMOJI)
+            )
+        emoji_label.grid(row=0, column=1, sticky="w",
+                         padx=(Spacing.MD, Spacing.SM), pady=row0_pady)
         
         if title:
             tk.Label(
-                top, text=title, bg=bg, fg=fg,
-                font=(Typography.FONT_FAMILY, Typography.SIZE_BODY, "bold"),
+                self, text=title, bg=bg, fg=fg,
+                font=_font(_FONT_BODY_BOLD),
                 anchor="w"
-            ).pack(side=tk.LEFT, fill=tk.X, expand=True)
+            ).grid(row=0, column=2, sticky="we", pady=row0_pady)
         
         dismiss = tk.Label(
-            top, text="✕", bg=bg, fg=fg_sec, cursor="hand2",
-            font=(Typography.FONT_FAMILY, 10)
+            self, text="✕", bg=bg, fg=fg_sec, cursor="hand2",
+            font=_font(_FONT_DISMISS)
         )
-        dismiss.pack(side=tk.RIGHT)
+        dismiss.grid(row=0, column=3, sticky="e", padx=(0, Spacing.MD), pady=row0_pady)
         dismiss.bind("<Button-1>", lambda e: self._dismiss(on_dismiss))
         
         if message:
             tk.Label(
-                content, text=message, bg=bg, fg=fg_sec,
-                font=(Typography.FONT_FAMILY, Typography.SIZE_CAPTION),
+                self, text=message, bg=bg, fg=fg_sec,
+                font=_font(_FONT_CAPTION),
                 anchor="w", wraplength=300, justify="left"
-            ).pack(fill=tk.X, pady=(Spacing.XS, 0))
+            ).grid(row=1, column=1, columnspan=3, sticky="we",
+                   padx=Spacing.MD, pady=(Spacing.XS, Spacing.SM))
         
         self._timer = None
         if duration > 0:
@@ -471,28 +727,77 @@ class ToastManager:
     def __init__(self, parent, dark_mode=True):
         self.parent = parent
         self.dark_mode = dark_mode
-        self.toasts = []
+        self.toasts = collections.deque(maxlen=5)
+        self._index = {}  # id(toast) -> toast, for O(1) dismiss
+        
+        # One after() for all toasts: heap of (deadline, seq, toast)
+        self._deadlines = []
+        self._seq = itertools.count()
+        self._timer = None
         
         self.container = tk.Frame(parent, bg="", bd=0, highlightthickness=0)
         self.container.place(relx=1.0, rely=0.0, anchor="ne", x=-Spacing.LG, y=Spacing.LG)
+        
+        self._emoji_images = self._preload_emoji_images()
+    
+    def _preload_emoji_images(self):
+        """Rasterize each variant's emoji once so the first toast shows instantly"""
+        fg = _toast_palette(self.dark_mode).fg
+        images = {}
+        for variant, vdata in Toast.VARIANTS.items():
+            try:
+                images[variant] = _icon_mod().render_emoji(vdata["emoji"], 16, fg)
+            except Exception:
+                images[variant] = None
+        return images
     
     def show(self, title="", message="", variant="info", duration=4000):
         """Show a toast notification"""
+        # Evict explicitly — deque(maxlen) would drop the oldest silently
+        if len(self.toasts) == self.toasts.maxlen:
+            oldest = self.toasts.popleft()
+            self._index.pop(id(oldest), None)
+            try:
+                oldest.destroy()
+            except Exception:
+                pass
+        
         toast = Toast(
             self.container, title=title, message=message,
-            variant=variant, duration=duration,
+            variant=variant, duration=0,
             dark_mode=self.dark_mode,
-            on_dismiss=self._on_toast_dismiss
+            on_dismiss=self._on_toast_dismiss,
+            emoji_image=self._emoji_images.get(variant)
         )
         toast.pack(fill=tk.X, pady=(0, Spacing.XS))
         self.toasts.append(toast)
+        self._index[id(toast)] = toast
         
-        if len(self.toasts) > 5:
-            oldest = self.toasts.pop(0)
-            try:
-                oldest.destroy()
-            except Exception:
-                pass
+        if duration > 0:
+            deadline = time.monotonic() + duration / 1000
+            heapq.heappush(self._deadlines, (deadline, next(self._seq), toast))
+            if self._deadlines[0][2] is toast:
+                self._rearm()
+    
+    def _rearm(self):
+        """Point the single timer at the earliest pending deadline"""
+        if self._timer is not None:
+            self.container.after_cancel(self._timer)
+            self._timer = None
+        if self._deadlines:
+            delay = max(0, int((self._deadlines[0][0] - time.monotonic()) * 1000))
+            self._timer = self.container.after(delay, self._tick)
+    
+    def _tick(self):
+        """Dismiss every toast whose deadline has passed"""
+        self._timer = None
+        now = time.monotonic()
+        while self._deadlines and self._deadlines[0][0] <= now:
+            toast = heapq.heappop(self._deadlines)[2]
+            # Skip toasts already closed by the user or evicted
+            if self._index.get(id(toast)) is toast:
+                toast._dismiss(self._on_toast_dismiss)
+        self._rearm()
     
     def success(self, title, message="", duration=4000):
         self.show(title, message, "success", duration)
@@ -507,5 +812,5 @@ class ToastManager:
         self.show(title, message, "info", duration)
     
     def _on_toast_dismiss(self, toast):
-        if toast in self.toasts:
+        if self._index.pop(id(toast), None) is not None:
             self.toasts.remove(toast)
@@ -3,17 +3,52 @@ OAuth Authentication Manager for YouTube
 Handles Google OAuth 2.0 authentication and token management
 """
 
+from __future__ import annotations
+
 import json
 import pickle
-import os
+import re
+import threading
 from pathlib import Path
-from typing import Optional, Tuple
-import webbrowser
+from typing import TYPE_CHECKING, Optional
+
+# google-auth and requests are imported where they are used, so sessions
+# that never log in don't pay for them at startup
+if TYPE_CHECKING:
+    from google.oauth2.credentials import Credentials
+
+
+# Shared keep-alive pool for Google/YouTube endpoints (avoids a TLS
+# handshake per call) — created on first use, see _session()
+_SESSION = None
+
+
+def _session():
+    """Return the shared requests.Session, creating it on first use"""
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        from http.cookiejar import DefaultCookiePolicy
+        from requests.adapters import HTTPAdapter
+        
+        session = requests.Session()
+        session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=1))
+        # Used from several threads at once: only the connection pool is
+        # shared, cookies stay on each response (see get_youtube_cookies)
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        _SESSION = session
+    return _SESSION
+
+# Google error signatures surfaced with a friendlier message in authenticate()
+_RE_ACCESS_DENIED = re.compile(r"access_denied|\b403\b", re.IGNORECASE)
+_RE_REDIRECT_MISMATCH = re.compile(r"redirect_uri_mismatch", re.IGNORECASE)
 
-from google_auth_oauthlib.flow import InstalledAppFlow
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-import requests
+_TOKENINFO_URL = 'https://www.googleapis.com/oauth2/v1/tokeninfo'
+
+_USER_AGENT = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
+    'AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+)
 
 
 class OAuthError(Exception):
@@ -24,6 +59,13 @@ class OAuthError(Exception):
 class OAuthManager:
     """Manages OAuth authentication with Google for YouTube access"""
     
+    __slots__ = (
+        "config_dir", "token_file", "legacy_token_file", "cookies_file",
+        "credentials_file", "_credentials_data", "_creds_parsed",
+        "_refresh_lock", "_bg_lock", "_refreshing", "_refresh_callbacks",
+        "_email_cache", "creds",
+    )
+    
     # Google OAuth scopes - minimal permissions
     SCOPES = ['https://www.googleapis.com/auth/youtube.readonly']
     
@@ -38,26 +80,40 @@ class OAuthManager:
         self.config_dir = Path(config_dir)
         self.config_dir.mkdir(exist_ok=True)
         
-        self.token_file = self.config_dir / "youtube_token.pickle"
+        self.token_file = self.config_dir / "youtube_token.json"
+        # Pre-JSON token format, migrated on first load
+        self.legacy_token_file = self.config_dir / "youtube_token.pickle"
         self.cookies_file = self.config_dir / "yt_cookies.txt"
         self.credentials_file = self.config_dir / "credentials.json"
         
         # Store credentials data (either passed in or will load from file)
         self._credentials_data = credentials_data
+        self._creds_parsed: Optional[dict] = None
+        
+        self._refresh_lock = threading.Lock()
+        # Background refresh state, guarded by _bg_lock
+        self._bg_lock = threading.Lock()
+        self._refreshing = False
+        self._refresh_callbacks: list = []
+        # (access token, email) for get_user_email()
+        self._email_cache: Optional[tuple[str, Optional[str]]] = None
         
         self.creds: Optional[Credentials] = None
         self._load_token()
     
     def _load_token(self) -> bool:
         """Load saved token from file"""
+        if not self.token_file.exists() and self.legacy_token_file.exists():
+            self._migrate_legacy_token()
+        
         if self.token_file.exists():
             try:
-                with open(self.token_file, 'rb') as token:
-                    self.creds = pickle.load(token)
+                info = json.loads(self.token_file.read_text(encoding='utf-8'))
+                self.creds = self._credentials_from_info(info)
                 
-                # Check if token is still valid
+                # Refresh an expired token without blocking startup
                 if self.creds and self.creds.expired and self.creds.refresh_token:
-                    self._refresh_token()
+                    self.refresh_in_background()
                 
                 return True
             except Exception as e:
@@ -65,6 +121,40 @@ class OAuthManager:
                 return False
         return False
     
+    def _migrate_legacy_token(self) -> bool:
+        """Convert a pickled token from older versions to the JSON format"""
+        try:
+            with open(self.legacy_token_file, 'rb') as token:
+                self.creds = pickle.load(token)
+            if self.creds and self._save_token():
+                # Keep the pickle until the new file is known to load back;
+                # drop an unreadable JSON so the next launch retries
+                try:
+                    info = json.loads(self.token_file.read_text(encoding='utf-8'))
+                    self._credentials_from_info(info)
+                except Exception:
+                    self.token_file.unlink()
+                    raise
+                self.legacy_token_file.unlink()
+                return True
+        except Exception as e:
+            print(f"Error migrating legacy token: {e}")
+        return False
+    
+    @classmethod
+    def _credentials_from_info(cls, info: dict) -> Credentials:
+        """Rebuild Credentials from saved token JSON
+        
+        Credentials.to_json() omits None fields, so a token granted without a
+        refresh_token is saved without the key, and from_authorized_user_info
+        rejects missing keys. Present them as None so such tokens still load
+        (they just can't be refreshed).
+        """
+        from google.oauth2.credentials import Credentials
+        
+        info = {**dict.fromkeys(("refresh_token", "client_id", "client_secret")), **info}
+        return Credentials.from_authorized_user_info(info, cls.SCOPES)
+    
     def _load_credentials(self) -> dict:
         """
         Load OAuth credentials from multiple sources in priority order:
@@ -82,6 +172,9 @@ class OAuthManager:
         if self._credentials_data:
             return self._credentials_data
         
+        if self._creds_parsed is not None:
+            return self._creds_parsed
+        
         # Priority 2: Load from config/credentials.json (development)
         if self.credentials_file.exists():
             try:
@@ -92,6 +185,7 @@ class OAuthManager:
                     if 'installed' in credentials:
                         required = ['client_id', 'client_secret']
                         if all(k in credentials['installed'] for k in required):
+                            self._creds_parsed = credentials
                             return credentials
                     
                     raise OAuthError(
@@ -110,10 +204,11 @@ class OAuthManager:
         )
     
     def _save_token(self) -> bool:
-        """Save token to file"""
+        """Save token to file (written to a temp file, then renamed into place)"""
         try:
-            with open(self.token_file, 'wb') as token:
-                pickle.dump(self.creds, token)
+            tmp_file = self.token_file.with_suffix('.tmp')
+            tmp_file.write_text(self.creds.to_json(), encoding='utf-8')
+            tmp_file.replace(self.token_file)
             return True
         except Exception as e:
             print(f"Error saving token: {e}")
@@ -124,25 +219,72 @@ class OAuthManager:
         if not self.creds or not self.creds.refresh_token:
             return False
         
-        try:
-            self.creds.refresh(Request())
-            self._save_token()
-            return True
-        except Exception as e:
-            print(f"Error refreshing token: {e}")
-            return False
+        with self._refresh_lock:
+            # Another thread may have refreshed (or logged out) while we waited
+            if self.creds is None:
+                return False
+            if self.creds.valid:
+                return True
+            try:
+                from google.auth.transport.requests import Request
+                
+                self.creds.refresh(Request())
+                self._save_token()
+                return True
+            except Exception as e:
+                print(f"Error refreshing token: {e}")
+                return False
     
-    def is_authenticated(self) -> bool:
-        """Check if user is authenticated"""
-        if not self.creds:
-            return False
+    def refresh_in_background(self, on_done=None):
+        """Refresh the token on a worker thread
         
-        # Try to refresh if expired
-        if self.creds.expired and self.creds.refresh_token:
-            self._refresh_token()
+        Only one refresh runs at a time; callers arriving while one is in
+        flight are attached to it instead of starting another.
         
+        Args:
+            on_done: Optional callable taking the refresh result (bool). It is
+                called on the worker thread, so UI callers must marshal it
+                back to Tk (e.g. via root.after).
+        """
+        with self._bg_lock:
+            if on_done is not None:
+                self._refresh_callbacks.append(on_done)
+            if self._refreshing:
+                return
+            self._refreshing = True
+        threading.Thread(target=self._background_refresh, daemon=True).start()
+    
+    def _background_refresh(self):
+        """Worker for refresh_in_background: refresh, then run callbacks"""
+        result = False
+        try:
+            result = self._refresh_token()
+        finally:
+            with self._bg_lock:
+                self._refreshing = False
+                callbacks, self._refresh_callbacks = self._refresh_callbacks, []
+            for callback in callbacks:
+                try:
+                    callback(result)
+                except Exception as e:
+                    print(f"Error in token refresh callback: {e}")
+    
+    def is_refreshing(self) -> bool:
+        """True while a background token refresh is in flight"""
+        return self._refreshing
+    
+    def has_valid_token(self) -> bool:
+        """Check for a usable access token — no I/O, safe to poll from the UI"""
         return self.creds is not None and self.creds.valid
     
+    def has_credentials(self) -> bool:
+        """Check if the user is signed in: a valid token, or one that can be
+        refreshed without user interaction (refresh_token / refresh running)
+        """
+        if self.creds is None:
+            return False
+        return self.creds.valid or bool(self.creds.refresh_token) or self._refreshing
+    
     def authenticate(self, on_browser_open=None) -> bool:
         """
         Perform OAuth authentication flow
@@ -157,6 +299,8 @@ class OAuthManager:
             OAuthError: With specific error message for common issues
         """
         try:
+            from google_auth_oauthlib.flow import InstalledAppFlow
+            
             # Load OAuth credentials
             credentials_data = self._load_credentials()
             
@@ -198,7 +342,7 @@ class OAuthManager:
             _WSGIApp.__call__ = _html_call
             
             try:
-                self.creds = flow.run_local_server(
+                new_creds = flow.run_local_server(
                     port=0,
                     open_browser=True,
                     success_message=success_html
@@ -207,6 +351,15 @@ class OAuthManager:
                 # Restore original to avoid side effects
                 _WSGIApp.__call__ = _original_call
             
+            # Google only returns a refresh_token on first consent; keep the
+            # one we already have when a re-auth comes back without it
+            old_refresh = self.creds.refresh_token if self.creds else None
+            if not new_creds.refresh_token and old_refresh:
+                info = json.loads(new_creds.to_json())
+                info["refresh_token"] = old_refresh
+                new_creds = self._credentials_from_info(info)
+            self.creds = new_creds
+            
             # Save token for future use
             self._save_token()
             
@@ -217,10 +370,10 @@ class OAuthManager:
             raise
         
         except Exception as e:
-            error_msg = str(e).lower()
+            error_msg = str(e)
             
             # Check for common OAuth errors
-            if 'access_denied' in error_msg or '403' in error_msg:
+            if _RE_ACCESS_DENIED.search(error_msg):
                 raise OAuthError(
                     "❌ Google OAuth Error 403: Access Denied\n\n"
                     "The OAuth app is in Testing mode. To fix:\n\n"
@@ -231,7 +384,7 @@ class OAuthManager:
                     "5. OR publish the app\n\n"
                     "See OAUTH_SETUP.md for detailed instructions"
                 )
-            elif 'redirect_uri_mismatch' in error_msg:
+            elif _RE_REDIRECT_MISMATCH.search(error_msg):
                 raise OAuthError(
                     "❌ Redirect URI mismatch\n\n"
                     "The OAuth app redirect URI is not configured correctly.\n"
@@ -248,29 +401,34 @@ class OAuthManager:
         Returns:
             Path to cookies file or None if failed
         """
-        if not self.is_authenticated():
+        # Runs on a worker thread, so an expired token is refreshed inline
+        if not self.has_valid_token() and not self._refresh_token():
             return None
         
         try:
-            # Create authenticated session
-            session = requests.Session()
+            from requests.cookies import RequestsCookieJar
             
-            # Add authorization header
-            session.headers['Authorization'] = f'Bearer {self.creds.token}'
-            session.headers['User-Agent'] = (
-                'Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
-                'AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+            # Access YouTube to establish session (headers per call, so the
+            # shared session never holds a token or cookies)
+            response = _session().get(
+                'https://www.youtube.com',
+                headers={
+                    'Authorization': f'Bearer {self.creds.token}',
+                    'User-Agent': _USER_AGENT,
+                },
+                timeout=10
             )
             
-            # Access YouTube to establish session
-            response = session.get('https://www.youtube.com', timeout=10)
-            
             if response.status_code != 200:
                 print(f"Failed to access YouTube: {response.status_code}")
                 return None
             
-            # Extract and save cookies in Netscape format
-            self._save_cookies_netscape(session.cookies, self.cookies_file)
+            # Collect this request's cookies, including those set along the
+            # redirect chain, and save them in Netscape format
+            cookies = RequestsCookieJar()
+            for r in (*response.history, response):
+                cookies.update(r.cookies)
+            self._save_cookies_netscape(cookies, self.cookies_file)
             
             return str(self.cookies_file)
         
@@ -287,23 +445,24 @@ class OAuthManager:
         .youtube.com	TRUE	/	TRUE	1234567890	cookie_name	cookie_value
         """
         try:
+            # Netscape cookie jar header
+            lines = [
+                "# Netscape HTTP Cookie File\n",
+                "# This is part of EasyCut YouTube Authentication\n",
+                "# Do not edit manually\n\n",
+            ]
+            append = lines.append
+            for cookie in cookies:
+                # Format: domain flag path secure expiration name value
+                append(
+                    f"{cookie.domain or '.youtube.com'}\tTRUE\t/\t"
+                    f"{'TRUE' if cookie.secure else 'FALSE'}\t{cookie.expires or 0}\t"
+                    f"{cookie.name}\t{cookie.value}\n"
+                )
+            
+            # One write for the whole jar
             with open(filepath, 'w') as f:
-                # Netscape cookie jar header
-                f.write("# Netscape HTTP Cookie File\n")
-                f.write("# This is part of EasyCut YouTube Authentication\n")
-                f.write("# Do not edit manually\n\n")
-                
-                for cookie in cookies:
-                    # Format: domain flag path secure expiration name value
-                    domain = cookie.domain or '.youtube.com'
-                    flag = 'TRUE'
-                    path = '/'
-                    secure = 'TRUE' if cookie.secure else 'FALSE'
-                    expires = str(cookie.expires) if cookie.expires else '0'
-                    name = cookie.name
-                    value = cookie.value
-                    
-                    f.write(f"{domain}\t{flag}\t{path}\t{secure}\t{expires}\t{name}\t{value}\n")
+                f.write("".join(lines))
         
         except Exception as e:
             print(f"Error saving cookies: {e}")
@@ -311,8 +470,9 @@ class OAuthManager:
     def logout(self) -> bool:
         """Remove saved token and logout"""
         try:
-            if self.token_file.exists():
-                self.token_file.unlink()
+            for path in (self.token_file, self.legacy_token_file):
+                if path.exists():
+                    path.unlink()
             if self.cookies_file.exists():
                 self.cookies_file.unlink()
             self.creds = None
@@ -326,28 +486,37 @@ class OAuthManager:
         if not self.creds:
             return None
         
+        token = self.creds.token
+        cached = self._email_cache
+        if cached is not None and cached[0] == token:
+            return cached[1]
+        
+        email = None
         try:
-            # The token info is stored in the credentials
-            # Try to get from stored info
-            if hasattr(self.creds, 'id_token'):
-                return self.creds.id_token.get('email')
-            
-            # Alternative: use Google's tokeninfo endpoint
-            response = requests.get(
-                f'https://www.googleapis.com/oauth2/v1/tokeninfo?access_token={self.creds.token}'
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                return data.get('email')
+            # The token info may be stored in the credentials (decoded claims)
+            id_token = getattr(self.creds, 'id_token', None)
+            if isinstance(id_token, dict):
+                email = id_token.get('email')
+            else:
+                # Alternative: use Google's tokeninfo endpoint — token as a
+                # query param rather than formatted into the URL
+                response = _session().get(
+                    _TOKENINFO_URL, params={'access_token': token}, timeout=10
+                )
+                if response.status_code == 200:
+                    email = response.json().get('email')
         
         except Exception as e:
             print(f"Error getting user email: {e}")
+            return None
         
-        return None
+        # Valid until the access token rotates
+        self._email_cache = (token, email)
+        return email
     
     def delete_token(self):
         """Delete stored OAuth token"""
-        if self.token_file.exists():
-            self.token_file.unlink()
+        for path in (self.token_file, self.legacy_token_file):
+            if path.exists():
+                path.unlink()
         self.creds = None
@@ -17,6 +17,8 @@ This module provides:
 - Status Bar: Real-time application status with dot indicator
 """
 
+import datetime
+import threading
 import tkinter as tk
 from tkinter import ttk, messagebox
 import json
@@ -275,6 +277,8 @@ class LogWidget(tk.Text):
         "SUCCESS": "#4ADE80",  # Green
     }
     
+    FLUSH_DELAY = 50  # ms between batched log writes
+    
     def __init__(self, parent, theme=None, **kwargs):
         """Initialize log widget
         
@@ -285,6 +289,12 @@ class LogWidget(tk.Text):
         """
         super().__init__(parent, **kwargs)
         self.theme = theme
+        # Buffered insert arguments awaiting _flush. add_log is called from
+        # download worker threads, so the buffer is guarded by a lock; a flush
+        # is armed only when the buffer goes from empty to non-empty.
+        self._pending = []
+        self._pending_lock = threading.Lock()
+        self._flush_id = None
         self.configure_colors()
         self._setup_tags()
     
@@ -327,42 +337,66 @@ class LogWidget(tk.Text):
     def add_log(self, message, level="INFO"):
         """Add timestamped log message with colored level indicator
         
+        Safe to call from any thread. Messages are buffered and written in
+        one batch FLUSH_DELAY ms after the first pending line, so bursts of
+        progress lines cost a single insert and an idle log schedules nothing.
+        
         Args:
             message (str): Log message content
             level (str): Log level (INFO, ERROR, WARNING, DEBUG, SUCCESS)
         """
-        import datetime
         timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-        
-        self.config(state=tk.NORMAL)
-        
-        # Insert timestamp with subtle color
-        start_idx = self.index(tk.END)
-        self.insert(tk.END, f"[{timestamp}] ")
-        end_idx = self.index(tk.END)
-        self.tag_add("timestamp", start_idx, end_idx)
-        
-        # Insert level tag with color
         level_upper = level.upper()
-        start_idx = self.index(tk.END)
-        self.insert(tk.END, f"[{level_upper}] ")
-        end_idx = self.index(tk.END)
-        tag_name = f"level_{level_upper}"
-        if tag_name in [self.tag_names()]:
-            pass
-        self.tag_add(tag_name, start_idx, end_idx)
         
-        # Insert message
-        self.insert(tk.END, f"{message}\n")
+        # (text, tags) pairs as accepted by Text.insert
+        chunks = (
+            f"[{timestamp}] ", "timestamp",
+            f"[{level_upper}] ", f"level_{level_upper}",
+            f"{message}\n", "",
+        )
+        with self._pending_lock:
+            arm = not self._pending
+            self._pending.extend(chunks)
+        
+        if arm:
+            # tkinter forwards after() from worker threads to the Tk thread,
+            # the same way the app's root.after(0, ...) callbacks do
+            try:
+                self._flush_id = self.after(self.FLUSH_DELAY, self._flush)
+            except (RuntimeError, tk.TclError):
+                pass  # Interpreter is shutting down
+    
+    def _flush(self):
+        """Write all buffered log lines with a single insert (Tk thread only)"""
+        self._flush_id = None
+        if not self.winfo_exists():
+            return
+        
+        # Emptying the buffer lets the next add_log arm a new flush
+        with self._pending_lock:
+            chunks, self._pending = self._pending, []
+        if not chunks:
+            return
         
+        self.config(state=tk.NORMAL)
+        self.insert(tk.END, *chunks)
         self.see(tk.END)
         self.config(state=tk.DISABLED)
     
     def clear(self):
         """Clear all log messages from widget"""
+        with self._pending_lock:
+            self._pending = []
         self.config(state=tk.NORMAL)
         self.delete(1.0, tk.END)
         self.config(state=tk.DISABLED)
+    
+    def destroy(self):
+        """Cancel a pending flush before the widget goes away"""
+        if self._flush_id is not None:
+            self.after_cancel(self._flush_id)
+            self._flush_id = None
+        super().destroy()
 
 
 class StatusBar(ttk.Frame):